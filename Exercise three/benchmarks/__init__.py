@@ -0,0 +1,3 @@
+"""
+Benchmarks for Student Manager - run with: python -m benchmarks.run
+"""
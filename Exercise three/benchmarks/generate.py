@@ -0,0 +1,27 @@
+import argparse
+import random
+
+FIRST_NAMES = ["Ron", "John", "Jo", "Sam", "Les", "Matt", "Alan", "Jake", "Gareth", "Lee",
+               "Amy", "Priya", "Chen", "Fatima", "Olu", "Maria", "Tom", "Zoe", "Ivan", "Noor"]
+LAST_NAMES = ["Herrema", "Curry", "Hyde", "Sturtivant", "Ferdinand", "Thompson", "Shearer",
+              "Hobbs", "Southgate", "Scott", "Patel", "Wong", "Okafor", "Garcia", "Novak"]
+
+def generate_roster(path, rows, seed=0):
+    """Write a synthetic studentMarks.txt with unique IDs, returns rows written"""
+    rng = random.Random(seed)
+    ids = list(range(1000, 1000 + rows))
+    rng.shuffle(ids)
+    with open(path, "w") as file:
+        for student_id in ids:
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            marks = [rng.randint(0, 20) for _ in range(3)]
+            file.write(f"{student_id},{name},{marks[0]},{marks[1]},{marks[2]},{rng.randint(0, 100)}\n")
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic roster file")
+    parser.add_argument("output")
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    generate_roster(args.output, args.rows, args.seed)
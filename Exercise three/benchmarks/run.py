@@ -0,0 +1,181 @@
+"""
+Time the data and view layers on synthetic rosters and write JSON results
+
+    python -m benchmarks.run --sizes 1000 10000 --output bench_results.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+from benchmarks import stub_tk
+from benchmarks.generate import generate_roster
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+SORT_ORDERS = ["id", "name", "percentage", "grade"]
+
+def best_of(func, repeat):
+    """Fastest of repeat runs, in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def quiet():
+    """Swallow the modules' progress prints while timing"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+def full_scan_stats(students):
+    """The five passes setup_stats used to make, kept for comparison"""
+    total = len(students)
+    if not total:
+        return
+    sum(s.percentage for s in students) / total
+    max(s.percentage for s in students)
+    sum(1 for s in students if s.percentage >= 40)
+    sum(1 for s in students if s.grade == 'A')
+    sum(1 for s in students if s.grade == 'F')
+
+def bench_data(path, workdir, repeat):
+    """File I/O, stats, sorting and highest/lowest without any widgets"""
+    import modules.file_manager as file_manager
+    from modules.sorted_views import SortedViews, SORT_KEYS
+    from modules.stats import StatsAggregator
+
+    # Always time the text format against the generated file
+    file_manager.STORAGE_FORMAT = 'text'
+    journal = os.path.join(workdir, "bench.journal")
+    out = os.path.join(workdir, "saved.txt")
+    results = {}
+
+    with quiet():
+        results['load_students'] = best_of(lambda: file_manager.load_students(path, journal), repeat)
+        students = file_manager.load_students(path, journal)
+        results['save_students'] = best_of(lambda: file_manager.save_students(students, out, journal), repeat)
+
+    results['stats_full_scan'] = best_of(lambda: full_scan_stats(students), repeat)
+    results['stats_aggregator_build'] = best_of(lambda: StatsAggregator(students), repeat)
+
+    views = SortedViews(students)
+    results['sorted_views_build'] = best_of(lambda: SortedViews(students), repeat)
+    for order in SORT_ORDERS:
+        results[f'sort_{order}_full'] = best_of(lambda: sorted(students, key=SORT_KEYS[order]), repeat)
+        results[f'sort_{order}_view'] = best_of(lambda: views.view(order), repeat)
+
+    results['highest_scan'] = best_of(lambda: max(students, key=lambda s: s.percentage), repeat)
+    results['lowest_scan'] = best_of(lambda: min(students, key=lambda s: s.percentage), repeat)
+    results['highest_view'] = best_of(lambda: views.top(1), repeat)
+    results['lowest_view'] = best_of(lambda: views.bottom(1), repeat)
+    return students, results
+
+class ReadyRoster:
+    """Looks like a finished Preloader so StudentManager skips file loading"""
+    def __init__(self, students):
+        from modules.preloader import RosterData
+        self.data = RosterData(students)
+        self.progress = 1
+        self.data_ready = threading.Event()
+        self.data_ready.set()
+
+def bench_view(students, repeat):
+    """StudentManager on the stub widget layer: widget counts and timings"""
+    tk = sys.modules["tkinter"]
+    from modules.constants import WATCH
+    from modules.student_manager import StudentManager
+
+    # Its poll reschedules itself, so run_pending would spend its whole
+    # limit stat'ing the real data file on every call
+    WATCH['enabled'] = False
+
+    results = {}
+    roster = ReadyRoster(students)
+    root = tk.Tk()
+
+    before = stub_tk.counts['widgets']
+    start = time.perf_counter()
+    with quiet():
+        manager = StudentManager(root, roster)
+        stub_tk.run_pending()
+    results['manager_build'] = time.perf_counter() - start
+    results['manager_build_widgets'] = stub_tk.counts['widgets'] - before
+
+    def refresh():
+        manager.refresh_student_list()
+        stub_tk.run_pending()
+
+    before = stub_tk.counts['widgets']
+    results['refresh_student_list'] = best_of(refresh, repeat)
+    results['refresh_student_list_widgets'] = (stub_tk.counts['widgets'] - before) / repeat
+
+    for order in SORT_ORDERS:
+        def apply(order=order):
+            manager.sort_var.set(order)
+            manager.apply_sorting()
+            stub_tk.run_pending()
+        results[f'apply_sorting_{order}'] = best_of(apply, repeat)
+
+    with quiet():
+        results['highest'] = best_of(manager.highest, repeat)
+        results['lowest'] = best_of(manager.lowest, repeat)
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Student Manager benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="roster sizes to generate (default: 1k to 1M)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per timing, best is kept")
+    parser.add_argument("--output", default="bench_results.json", help="JSON file to write")
+    parser.add_argument("--no-view", action="store_true", help="skip the widget layer")
+    args = parser.parse_args(argv)
+
+    # Before anything imports the real tkinter
+    if not args.no_view:
+        stub_tk.install()
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'repeat': args.repeat,
+        },
+        'sizes': {},
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            path = os.path.join(workdir, f"roster_{size}.txt")
+            generate_roster(path, size)
+            print(f"Benchmarking {size} students...")
+
+            students, results = bench_data(path, workdir, args.repeat)
+            if not args.no_view:
+                results.update(bench_view(students, args.repeat))
+            report['sizes'][str(size)] = results
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Stand-in tkinter module that counts widgets instead of drawing them
+"""
+import sys
+import types
+
+counts = {'widgets': 0}
+pending = []  # Callbacks queued with after/after_idle
+
+class Variable:
+    def __init__(self, master=None, value=None):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+class Widget:
+    def __init__(self, master=None, **options):
+        counts['widgets'] += 1
+        self.options = options
+        self.items = 0
+
+    def __getattr__(self, name):
+        # Layout, binding and window manager calls are all no-ops
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, option):
+        return self.options.get(option, "")
+
+    def get(self, *args):
+        return self.options.get('text', "")
+
+    def winfo_children(self):
+        return []
+
+    def bindtags(self, tags=None):
+        return (f"w{id(self)}", type(self).__name__, ".", "all")
+
+    def create_window(self, *args, **kwargs):
+        self.items += 1
+        return self.items
+
+    create_image = create_rectangle = create_text = create_line = create_window
+
+    def after(self, ms, func=None, *args):
+        if func is not None:
+            pending.append((func, args))
+        return f"after#{len(pending)}"
+
+    def after_idle(self, func, *args):
+        return self.after(0, func, *args)
+
+def run_pending(limit=10000):
+    """Run queued after callbacks, as the Tk loop would"""
+    ran = 0
+    while pending and ran < limit:
+        func, args = pending.pop(0)
+        func(*args)
+        ran += 1
+
+def install():
+    """Put the stub in sys.modules in place of tkinter, returns it"""
+    tk = types.ModuleType("tkinter")
+    for name in ["Tk", "Toplevel", "Frame", "Label", "Canvas", "Entry", "Scrollbar",
+                 "Radiobutton", "Checkbutton", "Button", "Spinbox", "PhotoImage"]:
+        setattr(tk, name, type(name, (Widget,), {}))
+    tk.StringVar = tk.IntVar = tk.BooleanVar = Variable
+    tk.TclError = Exception
+    tk.END = "end"
+
+    filedialog = types.ModuleType("tkinter.filedialog")
+    filedialog.askopenfilename = lambda **kwargs: ""
+    tk.filedialog = filedialog
+
+    sys.modules["tkinter"] = tk
+    sys.modules["tkinter.filedialog"] = filedialog
+    return tk
@@ -1,7 +1,13 @@
-import tkinter as tk
-from modules.gui import StartScreen
+import sys
 
 def main():
+    # Any arguments mean command line mode, which never loads tkinter
+    if len(sys.argv) > 1:
+        from modules.cli import run
+        sys.exit(run(sys.argv[1:]))
+
+    import tkinter as tk
+    from modules.gui import StartScreen
     root = tk.Tk()
     start_screen = StartScreen(root)
     root.mainloop()
@@ -0,0 +1,160 @@
+"""
+Command line mode for Student Manager - no tkinter or PIL imports here
+"""
+import argparse
+import contextlib
+import csv
+import heapq
+import json
+import sys
+from modules.constants import DATA_FILE, STORAGE_FORMAT, REPORTS
+from modules.file_manager import (load_students, load_student_table, format_student,
+                                  write_binary_file)
+from modules.importer import import_csv
+from modules.sorted_views import SORT_KEYS
+from modules.stats import StatsAggregator
+
+def load_roster():
+    """load_students with its progress messages sent to stderr"""
+    with contextlib.redirect_stdout(sys.stderr):
+        return load_students()
+
+def load_table():
+    """StudentTable for the reports if REPORTS['columnar'] asks for one
+
+    None means use Student objects, also when a record doesn't fit the table.
+    """
+    if not REPORTS['columnar'] or STORAGE_FORMAT == 'sqlite':
+        return None
+    with contextlib.redirect_stdout(sys.stderr):
+        return load_student_table()
+
+def cmd_stats(args):
+    """Print the same numbers as the stats bar"""
+    stats = None
+    if STORAGE_FORMAT == 'sqlite':
+        # Let the database aggregate instead of loading every row
+        from modules.file_manager import open_sqlite_store
+        with contextlib.redirect_stdout(sys.stderr):
+            stats = open_sqlite_store().stats()
+    else:
+        table = load_table()
+        if table is not None:
+            stats = table.stats()
+
+    if stats is not None:
+        count, average, highest, passing = (stats['count'], stats['average'],
+                                            stats['highest'], stats['passing'])
+        grade_counts = stats['grade_counts']
+    else:
+        stats = StatsAggregator(load_roster())
+        count, average, highest, passing = (stats.count, stats.average_percentage,
+                                            stats.highest_percentage, stats.passing_percentage)
+        grade_counts = stats.grade_counts
+
+    if args.json:
+        print(json.dumps({'students': count, 'average': average, 'highest': highest,
+                          'passing': passing, 'grades': grade_counts}))
+        return 0
+
+    print(f"Students: {count}")
+    print(f"Average:  {average:.1f}%")
+    print(f"Highest:  {highest:.1f}%")
+    print(f"Passing:  {passing:.1f}%")
+    print("Grades:   " + "  ".join(f"{grade}={n}" for grade, n in grade_counts.items()))
+    return 0
+
+def cmd_top(args):
+    """Print the best (or worst) N students"""
+    students = None
+    if STORAGE_FORMAT == 'sqlite':
+        # Let the database pick them through its total_score index
+        from modules.file_manager import open_sqlite_store
+        with contextlib.redirect_stdout(sys.stderr):
+            store = open_sqlite_store()
+        students = store.bottom(args.n) if args.bottom else store.top(args.n)
+    else:
+        table = load_table()
+        if table is not None:
+            students = table.bottom(args.n) if args.bottom else table.top(args.n)
+
+    if students is None:
+        key = SORT_KEYS['percentage'] if args.bottom else SORT_KEYS['rank']
+        students = heapq.nsmallest(args.n, load_roster(), key=key)
+    for rank, student in enumerate(students, start=1):
+        print(f"{rank:>3}. {student.student_id}  {student.name:<25} "
+              f"{student.percentage:5.1f}%  {student.grade}")
+    return 0
+
+def cmd_export(args):
+    """Write the roster in another format"""
+    students = None
+    if STORAGE_FORMAT == 'sqlite':
+        # Sorted by the database
+        from modules.file_manager import open_sqlite_store
+        with contextlib.redirect_stdout(sys.stderr):
+            students = open_sqlite_store().ordered(args.sort)
+    else:
+        table = load_table()
+        if table is not None:
+            students = table.order_by(args.sort)
+
+    if students is None:
+        students = load_roster()
+        students.sort(key=SORT_KEYS[args.sort])
+
+    if args.format == 'binary':
+        write_binary_file(students, args.output)
+    else:
+        with open(args.output, "w", newline="") as file:
+            if args.format == 'csv':
+                writer = csv.writer(file)
+                writer.writerow(["id", "name", "cw1", "cw2", "cw3", "exam",
+                                 "total", "percentage", "grade"])
+                for s in students:
+                    writer.writerow([s.student_id, s.name, s.mark1, s.mark2, s.mark3,
+                                     s.exam_mark, s.total_score, f"{s.percentage:.1f}", s.grade])
+            else:
+                file.writelines(format_student(s) for s in students)
+    print(f"Exported {len(students)} student records to {args.output}")
+    return 0
+
+def cmd_validate(args):
+    """Check a data or CSV file, exit status 1 if any row is bad"""
+    students, rejected = import_csv(args.file)
+    for line_no, fields, reason in rejected:
+        print(f"line {line_no}: {reason}: {','.join(fields)}")
+    print(f"{len(students)} valid, {len(rejected)} rejected")
+    return 1 if rejected else 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py", description="Student Manager reports")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats = commands.add_parser("stats", help="roster statistics")
+    stats.add_argument("--json", action="store_true", help="print as JSON")
+    stats.set_defaults(run=cmd_stats)
+
+    top = commands.add_parser("top", help="best or worst students by percentage")
+    top.add_argument("-n", type=int, default=5, help="how many students (default 5)")
+    top.add_argument("--bottom", action="store_true", help="worst students instead")
+    top.set_defaults(run=cmd_top)
+
+    export = commands.add_parser("export", help="write the roster to a file")
+    export.add_argument("output", help="file to write")
+    export.add_argument("--format", choices=["text", "csv", "binary"], default="csv")
+    export.add_argument("--sort", choices=[k for k in SORT_KEYS if k != 'rank'], default="id")
+    export.set_defaults(run=cmd_export)
+
+    validate = commands.add_parser("validate", help="check a data or CSV file")
+    validate.add_argument("file", nargs="?", default=DATA_FILE,
+                          help="file to check (default: the data file)")
+    validate.set_defaults(run=cmd_validate)
+    return parser
+
+def run(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.run(args)
+
+if __name__ == "__main__":
+    sys.exit(run())
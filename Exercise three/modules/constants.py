@@ -11,6 +11,57 @@ HEIGHT = 675
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_FILE = os.path.join(BASE_DIR, "media", "studentMarks.txt")
 BG_IMAGE = os.path.join(BASE_DIR, "media", "student_manager_bg.jpg")
+IMAGE_CACHE_DIR = os.path.join(BASE_DIR, "media", ".cache")  # Pre-resized images
+
+# Journaled storage - single changes are appended here instead of
+# rewriting DATA_FILE, and folded back in once the log grows too big
+JOURNAL_ENABLED = True
+JOURNAL_FILE = DATA_FILE + ".journal"
+JOURNAL_COMPACT_BYTES = 64 * 1024
+
+# Write-behind saving - changes made within debounce_ms of each other
+# are written together by a worker thread
+SAVE = {
+    'debounce_ms': 1000
+}
+
+# Watch DATA_FILE for changes made by other programs (text format only)
+WATCH = {
+    'enabled': True,
+    'poll_ms': 2000
+}
+
+# Storage format - 'text' is the comma separated DATA_FILE, 'binary' keeps
+# fixed-size records in BINARY_DATA_FILE and 'sqlite' uses SQLITE_DATA_FILE.
+# The binary and sqlite files are built from DATA_FILE if missing. With
+# 'sqlite' the command line queries the database, the GUI still keeps the
+# roster in memory (see SQLiteStore).
+STORAGE_FORMAT = 'text'
+BINARY_DATA_FILE = os.path.join(BASE_DIR, "media", "studentMarks.bin")
+SQLITE_DATA_FILE = os.path.join(BASE_DIR, "media", "studentMarks.db")
+
+# Command line reports - with 'columnar' on, stats and top read the text or
+# binary roster into a StudentTable (one array per field, NumPy if it is
+# installed) instead of Student objects. Its marks must fit in 16 bits,
+# IDs in 32 bits and names in 65535 bytes, sqlite storage ignores it.
+REPORTS = {
+    'columnar': False
+}
+
+# Background loading - students are parsed in chunks on a worker thread
+# and handed to the Tk loop every poll_ms
+LOAD = {
+    'chunk_size': 2000,
+    'poll_ms': 50,
+    'batches_per_tick': 5
+}
+
+# CSV import - files from parallel_bytes up are validated on a process pool
+IMPORT = {
+    'chunk_size': 5000,
+    'parallel_bytes': 1024 * 1024,
+    'workers': None  # One per CPU
+}
 
 # start screen buttons
 START_BTN_WIDTH = 1000
@@ -71,7 +122,10 @@ POS = {
     'details_x': 980,
     'details_y': 430,
     'details_w': 350,
-    'details_h': 350
+    'details_h': 350,
+    'extra_buttons_y': 228,
+    'import_x': 890,
+    'leaderboard_x': 1070
 }
 
 # Error Notification Constants
@@ -86,8 +140,38 @@ ERROR_NOTIFICATION = {
     'close_btn_hover': '#cc3333'
 }
 
+# Timing spans - the overlay is toggled with F12 and Ctrl+F12 dumps to dump_file
+TIMING = {
+    'enabled': False,
+    'samples': 200,  # Durations kept per span
+    'overlay_ms': 500,
+    'dump_file': os.path.join(BASE_DIR, "timings.json")
+}
+
+SEARCH = {
+    'debounce_ms': 250
+}
+
+LEADERBOARD = {
+    'default_n': 5,
+    'max_n': 10
+}
+
+# Grade and percentage histograms under the student list
+DISTRIBUTION = {
+    'x': 45,
+    'y': 588,
+    'w': 710,
+    'h': 78,
+    'grade_w': 220,  # Width of the grade chart, the percentage chart gets the rest
+    'bar_color': '#7fb3e0',
+    'fail_color': '#e08a7f'  # Percentage buckets below a pass
+}
+
 TABLE = {
     'headers': ["ID", "Name", "CW1", "CW2", "CW3", "CW Total", "Exam", "Total", "Grade"],
     'col_w': 12,
-    'select_color': '#a0c8f0'
+    'select_color': '#a0c8f0',
+    'pool_rows': 11,  # Row widgets kept alive, roughly one viewport
+    'row_tag': 'StudentRow'  # Bind tag shared by every cell, carries the row events
 }
\ No newline at end of file
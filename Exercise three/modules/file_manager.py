@@ -1,39 +1,458 @@
+import mmap
 import os
-from modules.constants import DATA_FILE
+import struct
+from modules.constants import (DATA_FILE, JOURNAL_FILE, JOURNAL_COMPACT_BYTES,
+                               LOAD, STORAGE_FORMAT, BINARY_DATA_FILE, SQLITE_DATA_FILE)
 from modules.student import Student
+from modules.timing import timed
 
-def load_students():
+# Journal operations
+OP_ADD = 'A'
+OP_UPDATE = 'U'
+OP_DELETE = 'D'
+
+# Binary format - a header, then one fixed-size record per student.
+# Deleted records keep their slot with the live flag cleared.
+BINARY_MAGIC = b'SMRB'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<4sHHI4x')  # magic, version, record size, record count
+BINARY_RECORD = struct.Struct('<Bi64s4B')  # live flag, ID, UTF-8 name, CW1-3, exam
+BINARY_NAME_BYTES = 64
+
+def parse_student(line):
+    """Parse one data line, returns None for malformed lines"""
+    data = line.strip().split(',')
+    if len(data) != 6:
+        return None
+    # Remove any extra whitespace
+    clean_data = [item.strip() for item in data]
+    return Student(clean_data[0], clean_data[1], clean_data[2],
+                   clean_data[3], clean_data[4], clean_data[5])
+
+def line_hash(line):
+    """Hash of a data line, used to spot records another program changed"""
+    return hash(line.strip())
+
+def format_student(student):
+    """Format a student as one data line"""
+    return (f"{student.student_id},{student.name},{student.mark1},"
+            f"{student.mark2},{student.mark3},{student.exam_mark}\n")
+
+@timed()
+def load_students(path=DATA_FILE, journal_path=JOURNAL_FILE):
     """Load student data from file"""
     students = []
     try:
-        with open(DATA_FILE, "r") as file:
-            for line in file:
-                data = line.strip().split(',')
-                if len(data) == 6:
-                    # Remove any extra whitespace
-                    clean_data = [item.strip() for item in data]
-                    student = Student(clean_data[0], clean_data[1], clean_data[2], 
-                                    clean_data[3], clean_data[4], clean_data[5])
-                    students.append(student)
+        for batch in iter_students(path=path, journal_path=journal_path):
+            students.extend(batch)
         print(f"Loaded {len(students)} student records")
     except FileNotFoundError:
-        print(f"File not found at: {DATA_FILE}")
+        print(f"File not found at: {path}")
     except Exception as e:
         print(f"Error loading data: {e}")
     return students
 
-def save_students(students):
+def load_student_table(path=DATA_FILE, journal_path=JOURNAL_FILE):
+    """Load student data into a columnar StudentTable
+
+    Returns None if a record does not fit the table's columns.
+    """
+    from modules.student_table import StudentTable
+    table = StudentTable()
+    try:
+        # Only one batch of Student objects is alive at a time
+        for batch in iter_students(path=path, journal_path=journal_path):
+            for student in batch:
+                table.append(student.student_id, student.name, student.mark1,
+                             student.mark2, student.mark3, student.exam_mark)
+        print(f"Loaded {len(table)} student records")
+    except FileNotFoundError:
+        print(f"File not found at: {path}")
+    except ValueError as e:
+        print(f"Error loading data: {e}")
+        return None
+    except Exception as e:
+        print(f"Error loading data: {e}")
+    return table
+
+def iter_students(chunk_size=LOAD['chunk_size'], path=DATA_FILE,
+                  journal_path=JOURNAL_FILE, progress=None, line_hashes=None):
+    """Yield students in batches from the configured storage format
+
+    progress, if given, is called as progress(done, total) after each
+    batch, in bytes for text and records for binary and sqlite.
+    line_hashes, if given, is filled for the text format only.
+    """
+    if STORAGE_FORMAT == 'binary':
+        return iter_binary_students(chunk_size, progress=progress)
+    if STORAGE_FORMAT == 'sqlite':
+        return iter_sqlite_students(chunk_size, progress=progress)
+    return iter_text_students(chunk_size, path, journal_path, progress, line_hashes)
+
+def iter_text_students(chunk_size=LOAD['chunk_size'], path=DATA_FILE,
+                       journal_path=JOURNAL_FILE, progress=None, line_hashes=None):
+    """Yield students from the text file, with the journal already applied
+
+    line_hashes, if given, is a dict filled with student_id -> line_hash
+    of each record's line in path, before the journal is applied.
+    """
+    # The journal is kept small by compaction, so read it up front and
+    # patch base records as they stream past
+    changes = {}
+    replay_journal(journal_path, changes)
+
+    total_bytes = os.path.getsize(path)
+    bytes_read = 0
+    seen = set()
+    batch = []
+
+    with open(path, "r") as file:
+        for line in file:
+            bytes_read += len(line)
+            student = parse_student(line)
+            if not student or student.student_id in seen:
+                continue
+            seen.add(student.student_id)
+            if line_hashes is not None:
+                line_hashes[student.student_id] = line_hash(line)
+
+            if student.student_id in changes:
+                student = changes.pop(student.student_id)
+                if student is None:
+                    continue
+            batch.append(student)
+
+            if len(batch) >= chunk_size:
+                yield batch
+                batch = []
+                if progress:
+                    progress(bytes_read, total_bytes)
+
+    # Whatever is left in the journal was added after the base file
+    batch.extend(student for student in changes.values() if student is not None)
+    if batch:
+        yield batch
+    if progress:
+        progress(total_bytes, total_bytes)
+
+def replay_journal(journal_path, changes):
+    """Collect journal records into a dict keyed by ID, None means deleted"""
+    if not os.path.exists(journal_path):
+        return
+
+    with open(journal_path, "r") as file:
+        for line in file:
+            op, _, rest = line.partition(',')
+            if op == OP_DELETE:
+                try:
+                    changes[int(rest)] = None
+                except ValueError:
+                    continue
+            elif op in (OP_ADD, OP_UPDATE):
+                try:
+                    student = parse_student(rest)
+                except ValueError:
+                    # Torn append from a crash, the rest of the log is still good
+                    continue
+                if student:
+                    changes[student.student_id] = student
+
+def write_atomic(path, lines):
+    """Write to a temp file, fsync it and rename it over path
+
+    A crash leaves either the old file or the new one, never half of it.
+    """
+    temp = path + ".tmp"
+    with open(temp, "w") as file:
+        file.writelines(lines)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp, path)
+
+@timed()
+def save_students(students, path=DATA_FILE, journal_path=JOURNAL_FILE):
     """Save student data to file"""
+    if STORAGE_FORMAT == 'binary':
+        return save_binary_students(students)
+    if STORAGE_FORMAT == 'sqlite':
+        return save_sqlite_students(students)
+
     try:
         # Create media directory if it doesn't exist
-        os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-        
-        with open(DATA_FILE, "w") as file:
-            for student in students:
-                file.write(f"{student.student_id},{student.name},{student.mark1},"
-                        f"{student.mark2},{student.mark3},{student.exam_mark}\n")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        write_atomic(path, (format_student(student) for student in students))
+
+        # The full file now supersedes anything journaled
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        print(f"Saved {len(students)} student records")
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
+
+@timed()
+def save_changes(changes, path=DATA_FILE, journal_path=JOURNAL_FILE):
+    """Persist a batch of (op, student) changes in one write
+
+    Needs the journal for the text format, without it use save_students.
+    """
+    if STORAGE_FORMAT == 'binary':
+        return all([save_binary_change(op, student) for op, student in changes])
+    if STORAGE_FORMAT == 'sqlite':
+        return all([save_sqlite_change(op, student) for op, student in changes])
+
+    records = [f"{OP_DELETE},{student.student_id}\n" if op == OP_DELETE
+               else f"{op},{format_student(student)}" for op, student in changes]
+    try:
+        with open(journal_path, "a") as file:
+            file.writelines(records)
+            file.flush()
+            os.fsync(file.fileno())
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
+
+def journal_full(journal_path=JOURNAL_FILE):
+    """True once the journal is big enough to fold into the data file"""
+    if STORAGE_FORMAT != 'text':
+        return False
+    try:
+        return os.path.getsize(journal_path) >= JOURNAL_COMPACT_BYTES
+    except OSError:
+        return False
+
+
+class BinaryStudentFile:
+    """Fixed-size student records read and written through mmap"""
+    def __init__(self, path=BINARY_DATA_FILE):
+        self.path = path
+        self.file = open(path, "r+b")
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+        magic, version, record_size, self.count = BINARY_HEADER.unpack_from(self.map, 0)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION or record_size != BINARY_RECORD.size:
+            self.close()
+            raise ValueError(f"Not a student records file: {path}")
+
+        self.rows = None  # student_id -> record number, built on first lookup
+
+    def __len__(self):
+        return self.count
+
+    def offset(self, n):
+        if not 0 <= n < self.count:
+            raise IndexError("student record out of range")
+        return BINARY_HEADER.size + n * BINARY_RECORD.size
+
+    def read(self, n):
+        """Student in record n, or None if it was deleted"""
+        live, student_id, name, *marks = BINARY_RECORD.unpack_from(self.map, self.offset(n))
+        if not live:
+            return None
+        return Student(student_id, name.rstrip(b'\0').decode('utf-8'), *marks)
+
+    def __iter__(self):
+        for n in range(self.count):
+            student = self.read(n)
+            if student:
+                yield student
+
+    def write(self, n, student):
+        """Overwrite record n in place"""
+        BINARY_RECORD.pack_into(self.map, self.offset(n), *pack_fields(student))
+
+    def append(self, student):
+        """Add a record at the end, returns its number"""
+        record = BINARY_RECORD.pack(*pack_fields(student))
+        self.map.close()
+        self.file.seek(0, os.SEEK_END)
+        self.file.write(record)
+        self.file.flush()
+        self.map = mmap.mmap(self.file.fileno(), 0)
+
+        n = self.count
+        self.count += 1
+        BINARY_HEADER.pack_into(self.map, 0, BINARY_MAGIC, BINARY_VERSION,
+                                BINARY_RECORD.size, self.count)
+        if self.rows is not None:
+            self.rows[student.student_id] = n
+        return n
+
+    def delete(self, n):
+        """Clear the live flag of record n"""
+        student = self.read(n)
+        self.map[self.offset(n)] = 0
+        if student and self.rows is not None:
+            self.rows.pop(student.student_id, None)
+
+    def find(self, student_id):
+        """Record number of a live student, or None"""
+        if self.rows is None:
+            self.rows = {}
+            for n in range(self.count):
+                live, record_id = struct.unpack_from('<Bi', self.map, self.offset(n))
+                if live:
+                    self.rows[record_id] = n
+        return self.rows.get(student_id)
+
+    def flush(self):
+        self.map.flush()
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+def pack_fields(student):
+    """Record fields for a student, refuses names that would not fit"""
+    name = student.name.encode('utf-8')
+    if len(name) > BINARY_NAME_BYTES:
+        raise ValueError(f"Name too long for binary format: {student.name}")
+    return (1, student.student_id, name, student.mark1, student.mark2,
+            student.mark3, student.exam_mark)
+
+def write_binary_file(students, path=BINARY_DATA_FILE):
+    """Write a complete binary records file"""
+    students = list(students)
+    temp = path + ".tmp"
+    with open(temp, "wb") as file:
+        file.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                                      BINARY_RECORD.size, len(students)))
+        for student in students:
+            file.write(BINARY_RECORD.pack(*pack_fields(student)))
+    os.replace(temp, path)
+    return len(students)
+
+def text_to_binary(src=DATA_FILE, dst=BINARY_DATA_FILE, journal_path=JOURNAL_FILE):
+    """Convert the text data file (with its journal) to the binary format"""
+    students = []
+    for batch in iter_text_students(path=src, journal_path=journal_path):
+        students.extend(batch)
+    count = write_binary_file(students, dst)
+    print(f"Converted {count} student records to {dst}")
+    return count
+
+def binary_to_text(src=BINARY_DATA_FILE, dst=DATA_FILE):
+    """Convert a binary records file back to the text format"""
+    records = BinaryStudentFile(src)
+    try:
+        count = 0
+        with open(dst, "w") as file:
+            for student in records:
+                file.write(format_student(student))
+                count += 1
+    finally:
+        records.close()
+    print(f"Converted {count} student records to {dst}")
+    return count
+
+# Open binary file shared by save_binary_change, so lookups stay warm
+binary_file = None
+
+def open_binary_file(path=BINARY_DATA_FILE):
+    global binary_file
+    if binary_file is None or binary_file.path != path:
+        if binary_file is not None:
+            binary_file.close()
+        if not os.path.exists(path):
+            text_to_binary(dst=path)
+        binary_file = BinaryStudentFile(path)
+    return binary_file
+
+def iter_binary_students(chunk_size=LOAD['chunk_size'], path=BINARY_DATA_FILE, progress=None):
+    """Yield students from the binary file in batches"""
+    records = open_binary_file(path)
+    total = len(records)
+    batch = []
+    for n in range(total):
+        student = records.read(n)
+        if student is None:
+            continue
+        batch.append(student)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+            if progress:
+                progress(n + 1, total)
+    if batch:
+        yield batch
+    if progress:
+        progress(total, total)
+
+def save_binary_students(students, path=BINARY_DATA_FILE):
+    """Rewrite the binary file, also drops the slots of deleted records"""
+    global binary_file
+    try:
+        if binary_file is not None and binary_file.path == path:
+            binary_file.close()
+            binary_file = None
+        count = write_binary_file(students, path)
+        print(f"Saved {count} student records")
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
+
+def save_binary_change(op, student, path=BINARY_DATA_FILE):
+    """Apply one change to the binary file in place"""
+    try:
+        records = open_binary_file(path)
+        n = records.find(student.student_id)
+        if op == OP_ADD or (op == OP_UPDATE and n is None):
+            records.append(student)
+        elif op == OP_UPDATE:
+            records.write(n, student)
+        elif op == OP_DELETE and n is not None:
+            records.delete(n)
+        records.flush()
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
+
+# Store shared by writes and queries on one thread (the save worker in the
+# app), loading opens its own
+sqlite_store = None
+
+def open_sqlite_store(path=SQLITE_DATA_FILE):
+    """Shared SQLite store, created from the text file on first use"""
+    global sqlite_store
+    from modules.sqlite_store import open_store
+    if sqlite_store is None or sqlite_store.path != path:
+        sqlite_store = open_store(path, seed=iter_text_students())
+    return sqlite_store
+
+def iter_sqlite_students(chunk_size=LOAD['chunk_size'], path=SQLITE_DATA_FILE, progress=None):
+    """Yield students from the SQLite database in batches"""
+    from modules.sqlite_store import open_store
+    # Own connection, this usually runs on the loader thread
+    store = open_store(path, seed=iter_text_students())
+    try:
+        yield from store.iter_students(chunk_size, progress)
+    finally:
+        store.close()
+
+def save_sqlite_students(students, path=SQLITE_DATA_FILE):
+    """Replace every row in one transaction"""
+    try:
+        open_sqlite_store(path).replace_all(students)
         print(f"Saved {len(students)} student records")
         return True
     except Exception as e:
         print(f"Error saving data: {e}")
-        return False
\ No newline at end of file
+        return False
+
+def save_sqlite_change(op, student, path=SQLITE_DATA_FILE):
+    """Apply one change as its own transaction"""
+    try:
+        store = open_sqlite_store(path)
+        if op == OP_DELETE:
+            store.delete(student.student_id)
+        else:
+            store.upsert(student)
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
@@ -0,0 +1,184 @@
+import os
+import queue
+import threading
+from array import array
+from bisect import bisect_left
+from .constants import *
+from .file_manager import parse_student, line_hash
+
+def file_signature(path):
+    """(mtime, size) of a file, None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def line_id(line):
+    """Student ID at the start of a data line, None if there is none"""
+    try:
+        return int(line.partition(',')[0])
+    except ValueError:
+        return None
+
+class LineHashes:
+    """Student IDs in sorted order with a hash of each one's data line"""
+    def __init__(self, ids=(), hashes=()):
+        self.ids = array('q', ids)
+        self.hashes = array('q', hashes)
+
+    def __len__(self):
+        return len(self.ids)
+
+def read_line_hashes(path):
+    """Hash every line of a data file, the first line for an ID wins"""
+    pairs = {}
+    with open(path, "r") as file:
+        for line in file:
+            student_id = line_id(line)
+            if student_id is not None and student_id not in pairs:
+                pairs[student_id] = line_hash(line)
+    return to_line_hashes(pairs)
+
+def to_line_hashes(pairs):
+    """LineHashes from a student_id -> line hash dict"""
+    ids = sorted(pairs)
+    return LineHashes(ids, (pairs[i] for i in ids))
+
+def diff_file(path, base):
+    """Compare a data file with the hashes it had before
+
+    Returns (changes, new_base) where changes is a list of
+    (student_id, Student) pairs, with None for removed students.
+    """
+    ids, hashes = base.ids, base.hashes
+    seen = bytearray(len(ids))
+    new_hashes = array('q', hashes)
+    added = {}  # student_id -> (hash, line) for IDs the old file did not have
+    changes = []
+
+    with open(path, "r") as file:
+        for line in file:
+            student_id = line_id(line)
+            if student_id is None:
+                continue
+            digest = line_hash(line)
+            pos = bisect_left(ids, student_id)
+
+            if pos < len(ids) and ids[pos] == student_id:
+                if seen[pos]:
+                    continue
+                seen[pos] = 1
+                if hashes[pos] != digest:
+                    new_hashes[pos] = digest
+                    changes.append((student_id, parse_student(line)))
+            elif student_id not in added:
+                added[student_id] = (digest, line)
+
+    # Merge the surviving IDs with the new ones, both already sorted
+    new_base = LineHashes()
+    extra = sorted(added)
+    i = 0
+    for pos, student_id in enumerate(ids):
+        if not seen[pos]:
+            changes.append((student_id, None))
+            continue
+        while i < len(extra) and extra[i] < student_id:
+            new_base.ids.append(extra[i])
+            new_base.hashes.append(added[extra[i]][0])
+            i += 1
+        new_base.ids.append(student_id)
+        new_base.hashes.append(new_hashes[pos])
+    for student_id in extra[i:]:
+        new_base.ids.append(student_id)
+        new_base.hashes.append(added[student_id][0])
+
+    changes.extend((student_id, parse_student(added[student_id][1])) for student_id in extra)
+    return changes, new_base
+
+class FileWatcher:
+    """Polls the data file and reports records another process changed
+
+    Only the changed records are reported, worked out by comparing line
+    hashes with the previous version of the file on a worker thread. Our
+    own rewrites are passed to rebase, so they never come back as changes.
+    """
+    def __init__(self, root, on_changes, path=DATA_FILE, baseline=None):
+        self.root = root
+        self.on_changes = on_changes  # Called on the Tk thread with diff_file's changes
+        self.path = path
+        self.settling = None  # New signature waiting one poll to be sure the write finished
+        self.generation = 0  # Bumped by rebase, results from before it are dropped
+        self.results = queue.Queue()
+
+        if baseline is not None:
+            # (signature, LineHashes) from the read that loaded the roster,
+            # so anything written since then is reported
+            self.signature, self.base = baseline
+            self.busy = False
+        else:
+            self.signature = file_signature(path)
+            self.base = None
+            self.busy = True  # A worker is reading the file
+            threading.Thread(target=self.read_base, args=(self.generation,), daemon=True).start()
+        self.root.after(WATCH['poll_ms'], self.poll)
+
+    def read_base(self, generation):
+        """Worker thread: hash the file as it is now"""
+        try:
+            self.results.put((generation, 'base', read_line_hashes(self.path)))
+        except Exception as e:
+            print(f"Error watching {self.path}: {e}")
+            self.results.put((generation, 'base', LineHashes()))
+
+    def read_changes(self, generation, base):
+        """Worker thread: diff the file against the last version seen"""
+        try:
+            self.results.put((generation, 'changes', diff_file(self.path, base)))
+        except Exception as e:
+            print(f"Error reading changes from {self.path}: {e}")
+            self.results.put((generation, 'error', None))
+
+    def rebase(self, signature, base):
+        """Take a file this program just wrote as the version to diff against"""
+        self.signature = signature
+        self.settling = None
+        self.base = base
+        self.generation += 1
+
+    def poll(self):
+        """Check the file signature, start a diff once it has settled"""
+        try:
+            generation, kind, payload = self.results.get_nowait()
+        except queue.Empty:
+            kind = None
+
+        if kind is not None:
+            self.busy = False
+            if generation != self.generation:
+                # Read before our own rewrite, rebase has the newer version
+                pass
+            elif kind == 'base':
+                self.base = payload
+            elif kind == 'changes':
+                changes, self.base = payload
+                if changes:
+                    self.on_changes(changes)
+            else:
+                # Try again on the next poll
+                self.signature = None
+
+        if not self.busy:
+            signature = file_signature(self.path)
+            if signature is not None and signature != self.signature:
+                if signature == self.settling:
+                    self.signature = signature
+                    self.settling = None
+                    self.busy = True
+                    threading.Thread(target=self.read_changes, args=(self.generation, self.base),
+                                     daemon=True).start()
+                else:
+                    # Still being written, or just finished - check again next time
+                    self.settling = signature
+
+        self.root.after(WATCH['poll_ms'], self.poll)
@@ -1,27 +1,19 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 from .constants import *
+from .image_cache import load_image
+from .preloader import Preloader
 
 class Tutorial:
-    def __init__(self, root):
+    def __init__(self, root, preloader=None):
         self.root = root
+        self.preloader = preloader
         self.current_slide = 0
         self.tutorial_images = [
-            self.load_image(TUTORIAL_1, WIDTH, HEIGHT),
-            self.load_image(TUTORIAL_2, WIDTH, HEIGHT)
+            load_image(TUTORIAL_1, WIDTH, HEIGHT),
+            load_image(TUTORIAL_2, WIDTH, HEIGHT)
         ]
         self.setup_ui()
     
-    def load_image(self, path, width, height):
-        """Load and resize image"""
-        try:
-            img = Image.open(path)
-            img = img.resize((width, height), Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"Error loading image {path}: {e}")
-            return None
-    
     def setup_ui(self):
         """Setup tutorial overlay"""
         self.canvas = tk.Canvas(self.root, width=WIDTH, height=HEIGHT, highlightthickness=0)
@@ -71,7 +63,7 @@ class Tutorial:
         
         # Import and create StudentManager
         from .student_manager import StudentManager
-        StudentManager(self.root)
+        StudentManager(self.root, self.preloader)
 
 class StartScreen:
     def __init__(self, root):
@@ -81,21 +73,14 @@ class StartScreen:
         self.root.resizable(False, False)
         
         # Load images
-        self.bg_image = self.load_image(START_BG, WIDTH, HEIGHT)
-        self.start_btn_image = self.load_image(START_BUTTON, START_BTN_WIDTH, START_BTN_HEIGHT)
-        self.quit_btn_image = self.load_image(QUIT_BUTTON, QUIT_BTN_WIDTH, QUIT_BTN_HEIGHT)
+        self.bg_image = load_image(START_BG, WIDTH, HEIGHT)
+        self.start_btn_image = load_image(START_BUTTON, START_BTN_WIDTH, START_BTN_HEIGHT)
+        self.quit_btn_image = load_image(QUIT_BUTTON, QUIT_BTN_WIDTH, QUIT_BTN_HEIGHT)
         
         self.setup_ui()
-    
-    def load_image(self, path, width, height):
-        """Load and resize image"""
-        try:
-            img = Image.open(path)
-            img = img.resize((width, height), Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"Error loading image {path}: {e}")
-            return None
+        
+        # Load the roster and later screens' images while the user is here
+        self.preloader = Preloader(self.root)
     
     def setup_ui(self):
         """Setup start screen UI"""
@@ -120,7 +105,7 @@ class StartScreen:
         """Start the main application"""
         for widget in self.root.winfo_children():
             widget.destroy()
-        Tutorial(self.root)  # Go to tutorial first
+        Tutorial(self.root, self.preloader)  # Go to tutorial first
 
     def quit_app(self, event=None):
         """Quit the application"""
@@ -0,0 +1,52 @@
+import hashlib
+import os
+import threading
+from .constants import IMAGE_CACHE_DIR
+
+# (path, width, height, mtime) -> PhotoImage, shared by every screen
+memory_cache = {}
+
+def cache_base(path, width, height, mtime):
+    """Cache file name without extension, changes when the source does"""
+    digest = hashlib.sha1(f"{os.path.abspath(path)}|{width}x{height}|{mtime}".encode()).hexdigest()
+    return os.path.join(IMAGE_CACHE_DIR, digest)
+
+def prepare_image(path, width, height):
+    """Make sure a resized copy of path is cached on disk, returns its path
+
+    Only touches files and PIL, so it is safe to call from a worker thread.
+    """
+    base = cache_base(path, width, height, os.path.getmtime(path))
+    for ext in (".ppm", ".png"):
+        if os.path.exists(base + ext):
+            return base + ext
+
+    from PIL import Image
+    img = Image.open(path)
+    img = img.resize((width, height), Image.LANCZOS)
+
+    # Raw PPM loads fastest, PNG only when there is transparency to keep
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        ext, img, options = ".png", img.convert("RGBA"), {"compress_level": 1}
+    else:
+        ext, img, options = ".ppm", img.convert("RGB"), {}
+
+    os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+    # Unique per thread, the preloader may be writing the same image
+    temp = f"{base}.{os.getpid()}.{threading.get_ident()}.tmp"
+    img.save(temp, format=ext[1:].upper(), **options)
+    os.replace(temp, base + ext)
+    return base + ext
+
+def load_image(path, width, height):
+    """Load and resize image, from the memory or disk cache when possible"""
+    try:
+        key = (path, width, height, os.path.getmtime(path))
+        if key not in memory_cache:
+            import tkinter as tk
+            # Tk reads the cached PPM/PNG itself, no PIL decode or resize
+            memory_cache[key] = tk.PhotoImage(file=prepare_image(path, width, height))
+        return memory_cache[key]
+    except Exception as e:
+        print(f"Error loading image {path}: {e}")
+        return None
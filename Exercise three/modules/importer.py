@@ -0,0 +1,123 @@
+import csv
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from modules.constants import IMPORT
+from modules.student import Student
+
+def validate_rows(rows):
+    """Check a chunk of (line_no, fields) rows
+
+    Runs in worker processes, so it only takes and returns plain tuples.
+    Returns (valid, rejected) where valid holds (line_no, student fields)
+    and rejected holds (line_no, fields, reason).
+    """
+    valid = []
+    rejected = []
+    for line_no, fields in rows:
+        fields = [field.strip() for field in fields]
+        if len(fields) != 6:
+            rejected.append((line_no, fields, "Expected 6 fields"))
+            continue
+
+        student_id, name, *marks = fields
+        try:
+            student_id = int(student_id)
+            marks = [int(mark) for mark in marks]
+        except ValueError:
+            rejected.append((line_no, fields, "ID and marks must be whole numbers"))
+            continue
+
+        if not name:
+            rejected.append((line_no, fields, "Missing name"))
+        elif ',' in name:
+            # The data file is comma separated, so this could not be saved
+            rejected.append((line_no, fields, "Name cannot contain commas"))
+        elif student_id < 1000 or student_id > 9999:
+            rejected.append((line_no, fields, "Student ID must be between 1000-9999"))
+        elif any(m < 0 or m > 20 for m in marks[:3]):
+            rejected.append((line_no, fields, "Coursework marks must be 0-20"))
+        elif marks[3] < 0 or marks[3] > 100:
+            rejected.append((line_no, fields, "Exam mark must be 0-100"))
+        else:
+            valid.append((line_no, (student_id, name, *marks)))
+    return valid, rejected
+
+def read_chunks(path, chunk_size=IMPORT['chunk_size']):
+    """Stream (line_no, fields) chunks from a CSV file, skipping a header row
+
+    line_no is the file line a record starts on, a quoted field can span lines.
+    """
+    with open(path, "r", newline="") as file:
+        chunk = []
+        reader = csv.reader(file)
+        next_line = 1
+        for fields in reader:
+            line_no, next_line = next_line, reader.line_num + 1
+            if not fields:
+                continue
+            if line_no == 1 and not fields[0].strip().isdigit():
+                continue
+            chunk.append((line_no, fields))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+def import_csv(path, existing_ids=()):
+    """Validate a CSV file of students
+
+    Large files are validated on a process pool. Returns the new Student
+    objects and the rejected (line_no, fields, reason) rows.
+    """
+    # Uniqueness needs the whole picture, so it is checked here in file order
+    seen = set(existing_ids)
+    students = []
+    rejected = []
+    for valid, bad in validate_chunks(path):
+        rejected.extend(bad)
+        for line_no, fields in valid:
+            if fields[0] in seen:
+                rejected.append((line_no, [str(field) for field in fields], "Student ID already exists"))
+                continue
+            seen.add(fields[0])
+            students.append(Student(*fields))
+
+    rejected.sort(key=lambda row: row[0])
+    return students, rejected
+
+def validate_chunks(path):
+    """Yield validate_rows results for each chunk of the file, in file order"""
+    chunks = read_chunks(path)
+    if os.path.getsize(path) < IMPORT['parallel_bytes']:
+        for chunk in chunks:
+            yield validate_rows(chunk)
+        return
+
+    # Spawn rather than fork, the parent has Tk state a fork would copy
+    context = multiprocessing.get_context("spawn")
+    workers = IMPORT['workers'] or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # Keep a couple of chunks per worker queued, so reading the file
+        # stays just ahead of validation instead of pickling all of it up front
+        window = 2 * workers
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(validate_rows, chunk))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def write_rejected_report(path, rejected):
+    """Write rejected rows next to the imported file, returns the report path"""
+    root, _ = os.path.splitext(path)
+    report = root + ".rejected.csv"
+    with open(report, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["line", "reason", "row"])
+        for line_no, fields, reason in rejected:
+            writer.writerow([line_no, reason, ",".join(fields)])
+    return report
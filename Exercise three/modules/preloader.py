@@ -0,0 +1,78 @@
+import threading
+from .constants import *
+from .file_manager import iter_students
+from .file_watcher import file_signature, to_line_hashes
+from .image_cache import prepare_image, load_image
+from .stats import StatsAggregator
+from .sorted_views import SortedViews
+from .search_index import SearchIndex
+from .timing import span
+
+# Images used after the start screen, in the order they are needed
+WARM_IMAGES = [
+    (TUTORIAL_1, WIDTH, HEIGHT),
+    (TUTORIAL_2, WIDTH, HEIGHT),
+    (BG_IMAGE, WIDTH, HEIGHT),
+]
+
+class RosterData:
+    """Students plus every index StudentManager keeps over them"""
+    def __init__(self, students, baseline=None):
+        self.students = students
+        self.baseline = baseline  # (signature, LineHashes) of the data file as read, for the watcher
+        self.by_id = {student.student_id: student for student in students}
+        self.stats = StatsAggregator(students)
+        self.sorted_views = SortedViews(students)
+        self.search_index = SearchIndex(students)
+
+class Preloader:
+    """Parses the roster and prepares images while the start screen is up"""
+    def __init__(self, root):
+        self.root = root
+        self.data = None  # RosterData once loaded, stays None on failure
+        self.progress = 0
+        self.data_ready = threading.Event()
+        self.images_ready = threading.Event()
+
+        threading.Thread(target=self.load_data, daemon=True).start()
+        threading.Thread(target=self.prepare_images, daemon=True).start()
+        self.root.after(LOAD['poll_ms'], self.poll_images)
+
+    def load_data(self):
+        """Worker thread: parse students and build the indexes"""
+        def report(done, total):
+            self.progress = done / total if total else 1
+
+        try:
+            students = []
+            signature = file_signature(DATA_FILE)
+            hashes = {}
+            with span("load_students"):
+                for batch in iter_students(progress=report, line_hashes=hashes):
+                    students.extend(batch)
+            self.data = RosterData(students, (signature, to_line_hashes(hashes)))
+            print(f"Preloaded {len(students)} student records")
+        except FileNotFoundError:
+            # Nothing to load is still a finished load
+            self.data = RosterData([])
+            print(f"File not found at: {DATA_FILE}")
+        except Exception as e:
+            print(f"Error preloading data: {e}")
+        self.data_ready.set()
+
+    def prepare_images(self):
+        """Worker thread: decode and resize images into the disk cache"""
+        for path, width, height in WARM_IMAGES:
+            try:
+                prepare_image(path, width, height)
+            except Exception as e:
+                print(f"Error preparing image {path}: {e}")
+        self.images_ready.set()
+
+    def poll_images(self):
+        """Turn prepared images into PhotoImages on the Tk thread"""
+        if not self.images_ready.is_set():
+            self.root.after(LOAD['poll_ms'], self.poll_images)
+            return
+        for path, width, height in WARM_IMAGES:
+            load_image(path, width, height)
@@ -0,0 +1,157 @@
+import queue
+import threading
+from .constants import *
+from .student import Student
+from .file_manager import (save_students, save_changes, journal_full, replay_journal,
+                           format_student, line_hash, OP_ADD, OP_UPDATE, OP_DELETE)
+from .file_watcher import file_signature, to_line_hashes
+
+def snapshot(student):
+    """Plain copy of a student's fields, safe to hand to another thread"""
+    return (student.student_id, student.name, student.mark1,
+            student.mark2, student.mark3, student.exam_mark)
+
+class Saver:
+    """Write-behind persistence - changes are coalesced for SAVE['debounce_ms']
+    and written by one worker thread, results come back on the Tk thread
+    """
+    def __init__(self, root, roster, on_saved=None, on_error=None, on_rewritten=None):
+        self.root = root
+        self.roster = roster  # Returns the live student list
+        self.on_saved = on_saved
+        self.on_error = on_error
+        # Called with (signature, LineHashes) after DATA_FILE is rewritten, for the watcher
+        self.on_rewritten = on_rewritten
+
+        self.pending = {}  # student_id -> (op, Student), not written yet
+        self.pending_full = False  # Rewrite everything instead
+        self.timer = None
+        self.outstanding = 0  # Jobs handed to the worker, not reported yet
+        self.polling = False
+
+        # Without the journal the text file can only be rewritten whole
+        self.full_only = STORAGE_FORMAT == 'text' and not JOURNAL_ENABLED
+        
+        # IDs with journal records, those win over DATA_FILE on the next load
+        self.journaled = set()
+        if STORAGE_FORMAT == 'text' and JOURNAL_ENABLED:
+            changes = {}
+            replay_journal(JOURNAL_FILE, changes)
+            self.journaled.update(changes)
+
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        threading.Thread(target=self.work, daemon=True).start()
+
+    def change(self, op, student):
+        """Queue one add, update or delete"""
+        key = student.student_id
+        previous = self.pending.get(key, (None, None))[0]
+
+        if previous == OP_ADD and op == OP_DELETE:
+            # Never written, nothing to undo
+            del self.pending[key]
+        elif previous == OP_ADD:
+            self.pending[key] = (OP_ADD, student)
+        elif previous == OP_DELETE and op == OP_ADD:
+            # The old record is still on disk, overwrite it
+            self.pending[key] = (OP_UPDATE, student)
+        else:
+            self.pending[key] = (op, student)
+        self.schedule()
+
+    def save_all(self):
+        """Queue a rewrite of the whole roster"""
+        self.pending_full = True
+        self.schedule()
+
+    def schedule(self):
+        """Restart the debounce timer"""
+        if self.timer:
+            self.root.after_cancel(self.timer)
+        self.timer = self.root.after(SAVE['debounce_ms'], self.flush)
+
+    def flush(self):
+        """Snapshot what is pending and hand it to the worker"""
+        if self.timer:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+
+        if self.pending_full or (self.pending and self.full_only):
+            job = ('full', [snapshot(student) for student in self.roster()])
+            self.journaled.clear()
+        elif self.pending:
+            job = ('changes', [(op, snapshot(student)) for op, student in self.pending.values()])
+            self.journaled.update(self.pending)
+        else:
+            return
+
+        self.pending = {}
+        self.pending_full = False
+        self.outstanding += 1
+        self.jobs.put(job)
+
+        if not self.polling:
+            self.polling = True
+            self.root.after(LOAD['poll_ms'], self.poll)
+
+    def work(self):
+        """Worker thread: write jobs in the order they were queued"""
+        while True:
+            kind, payload = self.jobs.get()
+            try:
+                rewritten = None
+                if kind == 'full':
+                    students = [Student(*fields) for fields in payload]
+                    ok = save_students(students)
+                    if ok and STORAGE_FORMAT == 'text' and WATCH['enabled']:
+                        # What DATA_FILE holds now, so the watcher can tell it from outside edits
+                        rewritten = (file_signature(DATA_FILE), to_line_hashes(
+                            {s.student_id: line_hash(format_student(s)) for s in students}))
+                else:
+                    ok = save_changes([(op, Student(*fields)) for op, fields in payload])
+                self.results.put((kind, ok, len(payload), ok and journal_full(), rewritten))
+            except Exception as e:
+                print(f"Error saving data: {e}")
+                self.results.put((kind, False, len(payload), False, None))
+            finally:
+                self.jobs.task_done()
+
+    def poll(self):
+        """Report finished jobs on the Tk thread"""
+        while True:
+            try:
+                kind, ok, count, compact, rewritten = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.outstanding -= 1
+
+            if rewritten and self.on_rewritten:
+                self.on_rewritten(*rewritten)
+
+            if not ok:
+                # Whatever is in memory goes out with the next write
+                self.pending_full = True
+                if self.on_error:
+                    self.on_error("Error: Could not save changes, retrying with the next one")
+            elif self.on_saved:
+                noun = "student records" if kind == 'full' else "changes" if count != 1 else "change"
+                self.on_saved(f"Saved {count} {noun}")
+
+            if compact and not self.pending_full:
+                # Fold the journal back into the data file
+                self.save_all()
+
+        if self.outstanding:
+            self.root.after(LOAD['poll_ms'], self.poll)
+        else:
+            self.polling = False
+
+    def overrides(self, student_id):
+        """True if saved changes for this student sit on top of DATA_FILE"""
+        return student_id in self.journaled or student_id in self.pending
+
+    def close(self):
+        """Write anything pending and wait for the worker, call before quitting"""
+        self.flush()
+        self.jobs.join()
@@ -0,0 +1,106 @@
+from bisect import bisect_left
+
+GRAM = 3
+
+def grams(text):
+    """Every GRAM-long slice of text"""
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+def search_texts(student):
+    """Lowercased strings a student can be found by"""
+    return [student.name.lower(), str(student.student_id)]
+
+class SearchIndex:
+    """Prefix and substring index over student names and IDs"""
+    def __init__(self, students=()):
+        # Sorted (token, student_id) pairs, tokens are the full name, each
+        # word of it and the ID, so prefixes are a bisect away
+        self.tokens = []
+
+        # Trigram -> student IDs, narrows substring queries to a few candidates
+        self.grams = {}
+
+        # student_id -> (texts, tokens) the student was indexed under
+        self.indexed = {}
+
+        self.add_many(students)
+
+    def entries(self, student):
+        texts = search_texts(student)
+        tokens = set(texts) | set(texts[0].split())
+        return texts, tokens
+
+    def add(self, student):
+        texts, tokens = self.entries(student)
+        self.indexed[student.student_id] = (texts, tokens)
+        for token in tokens:
+            pair = (token, student.student_id)
+            self.tokens.insert(bisect_left(self.tokens, pair), pair)
+        self.add_grams(student.student_id, texts)
+
+    def add_many(self, students):
+        """Index a batch with one sort of the token list
+
+        The sort covers every token already indexed, so a large roster
+        should be passed to the constructor in one go.
+        """
+        new_pairs = []
+        for student in students:
+            texts, tokens = self.entries(student)
+            self.indexed[student.student_id] = (texts, tokens)
+            new_pairs.extend((token, student.student_id) for token in tokens)
+            self.add_grams(student.student_id, texts)
+        if new_pairs:
+            self.tokens.extend(new_pairs)
+            self.tokens.sort()
+
+    def add_grams(self, student_id, texts):
+        for text in texts:
+            for gram in grams(text):
+                self.grams.setdefault(gram, set()).add(student_id)
+
+    def remove(self, student):
+        entry = self.indexed.pop(student.student_id, None)
+        if entry is None:
+            return
+
+        texts, tokens = entry
+        for token in tokens:
+            pos = bisect_left(self.tokens, (token, student.student_id))
+            del self.tokens[pos]
+        for gram in set().union(*map(grams, texts)):
+            ids = self.grams[gram]
+            ids.discard(student.student_id)
+            if not ids:
+                del self.grams[gram]
+
+    def update(self, student):
+        """Reindex a student whose name changed"""
+        self.remove(student)
+        self.add(student)
+
+    def search(self, query):
+        """IDs of students whose name or ID starts with or contains query"""
+        query = query.strip().lower()
+        if not query:
+            return set()
+
+        # Prefix matches on any token
+        matches = set()
+        pos = bisect_left(self.tokens, (query,))
+        while pos < len(self.tokens) and self.tokens[pos][0].startswith(query):
+            matches.add(self.tokens[pos][1])
+            pos += 1
+
+        # Substring matches, shorter queries are covered by the prefixes
+        if len(query) >= GRAM:
+            # Intersect starting from the rarest trigram
+            id_sets = sorted((self.grams.get(gram, set()) for gram in grams(query)), key=len)
+            candidates = set(id_sets[0])
+            for ids in id_sets[1:]:
+                candidates &= ids
+            for student_id in candidates - matches:
+                if any(query in text for text in self.indexed[student_id][0]):
+                    matches.add(student_id)
+
+        return matches
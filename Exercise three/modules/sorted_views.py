@@ -0,0 +1,124 @@
+from bisect import bisect_left
+
+# Sort keys end in the student ID so every key is unique and a student's
+# position can be found again by bisecting for its key
+SORT_KEYS = {
+    'id': lambda s: (s.student_id,),
+    'name': lambda s: (s.name.lower(), s.student_id),
+    'percentage': lambda s: (s.percentage, s.student_id),
+    'grade': lambda s: (s.grade, s.name.lower(), s.student_id),
+    # Leaderboard order, best first with ties going to the lower ID
+    'rank': lambda s: (-s.percentage, s.student_id),
+}
+
+class SortedView:
+    """Students kept in one sort order, updated by bisect"""
+    def __init__(self, key, students=()):
+        self.key = key
+        self.keys = []
+        self.students = []
+        self.key_of = {}  # student_id -> key the student is filed under
+        self.add_many(students)
+
+    def __len__(self):
+        return len(self.students)
+
+    def __getitem__(self, index):
+        return self.students[index]
+
+    def __iter__(self):
+        return iter(self.students)
+
+    def add(self, student):
+        key = self.key(student)
+        pos = bisect_left(self.keys, key)
+        self.keys.insert(pos, key)
+        self.students.insert(pos, student)
+        self.key_of[student.student_id] = key
+
+    def add_many(self, students):
+        """Merge a batch in with one sort instead of an insert per student
+
+        Still rebuilds both lists, so a large roster should be passed to
+        the constructor in one go rather than merged batch by batch.
+        """
+        pairs = [(self.key(s), s) for s in students]
+        if not pairs:
+            return
+        for key, student in pairs:
+            self.key_of[student.student_id] = key
+        # The existing keys are one sorted run, so this is close to a merge
+        pairs = list(zip(self.keys, self.students)) + pairs
+        pairs.sort(key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.students = [student for _, student in pairs]
+
+    def remove(self, student):
+        key = self.key_of.pop(student.student_id, None)
+        if key is None:
+            return
+        pos = bisect_left(self.keys, key)
+        del self.keys[pos]
+        del self.students[pos]
+
+    def update(self, student):
+        """Refile a student whose name or marks changed"""
+        self.remove(student)
+        self.add(student)
+
+    def index(self, student):
+        """Position of a student in this order"""
+        return bisect_left(self.keys, self.key_of[student.student_id])
+
+class ReversedView:
+    """Descending read of a SortedView, nothing extra to maintain"""
+    def __init__(self, view):
+        self.view = view
+
+    def __len__(self):
+        return len(self.view)
+
+    def __getitem__(self, index):
+        return self.view[len(self.view) - 1 - index]
+
+    def __iter__(self):
+        return reversed(self.view.students)
+
+    def index(self, student):
+        return len(self.view) - 1 - self.view.index(student)
+
+class SortedViews:
+    """One SortedView per entry in SORT_KEYS"""
+    def __init__(self, students=()):
+        self.views = {name: SortedView(key, students) for name, key in SORT_KEYS.items()}
+        self.reversed_views = {name: ReversedView(view) for name, view in self.views.items()}
+
+    def add(self, student):
+        for view in self.views.values():
+            view.add(student)
+
+    def add_many(self, students):
+        for view in self.views.values():
+            view.add_many(students)
+
+    def remove(self, student):
+        for view in self.views.values():
+            view.remove(student)
+
+    def update(self, student):
+        for view in self.views.values():
+            view.update(student)
+
+    def top(self, n):
+        """Best n students, highest percentage first"""
+        return self.views['rank'][:n]
+
+    def bottom(self, n):
+        """Worst n students, lowest percentage first"""
+        return self.views['percentage'][:n]
+
+    def view(self, name, descending=False):
+        """Live view for a sort order, kept current by add/remove/update"""
+        if descending:
+            return self.reversed_views[name]
+        return self.views[name]
@@ -0,0 +1,194 @@
+import os
+import sqlite3
+import tempfile
+from modules.constants import LOAD, SQLITE_DATA_FILE
+from modules.student import Student
+
+# Lowest total score for each grade, worked out from Student.grade so the
+# SQL and the Python model can never disagree on a boundary
+GRADE_FLOORS = {}
+for total in range(160, -1, -1):
+    GRADE_FLOORS[Student(0, "", 0, 0, 0, total).grade] = total
+PASS_FLOOR = min(total for total in range(161) if (total / 160) * 100 >= 40)
+
+GRADE_CASE = ("CASE WHEN total_score >= {A} THEN 'A' WHEN total_score >= {B} THEN 'B' "
+              "WHEN total_score >= {C} THEN 'C' WHEN total_score >= {D} THEN 'D' "
+              "ELSE 'F' END").format(**GRADE_FLOORS)
+
+# SQL for each SORT_KEYS order, NOCASE only folds ASCII letters
+ORDER_BY = {
+    'id': "student_id",
+    'name': "name COLLATE NOCASE, student_id",
+    'percentage': "total_score, student_id",
+    'grade': f"{GRADE_CASE}, name COLLATE NOCASE, student_id",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    mark1 INTEGER NOT NULL,
+    mark2 INTEGER NOT NULL,
+    mark3 INTEGER NOT NULL,
+    exam_mark INTEGER NOT NULL,
+    total_score INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_name ON students (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS students_total ON students (total_score, student_id);
+"""
+
+COLUMNS = "student_id, name, mark1, mark2, mark3, exam_mark"
+
+def row_values(student):
+    return (student.student_id, student.name, student.mark1, student.mark2,
+            student.mark3, student.exam_mark, student.total_score)
+
+class SQLiteStore:
+    """Student storage in an SQLite database
+
+    Each instance owns one connection, so open a separate store on any
+    thread other than the one that created it.
+
+    The command line answers stats, top and export from the queries below.
+    The GUI still loads the roster and keeps its own indexes in this mode:
+    its saves are write-behind, so the database can lag what is on screen
+    by up to SAVE['debounce_ms'] and can't answer for the table.
+    """
+    def __init__(self, path=SQLITE_DATA_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    # Reads
+
+    def iter_students(self, chunk_size=LOAD['chunk_size'], progress=None):
+        """Yield students in batches, progress counts rows"""
+        total = len(self)
+        done = 0
+        cursor = self.conn.execute(f"SELECT {COLUMNS} FROM students ORDER BY student_id")
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            done += len(rows)
+            yield [Student(*row) for row in rows]
+            if progress:
+                progress(done, total)
+        if progress:
+            progress(total, total)
+
+    def get(self, student_id):
+        row = self.conn.execute(f"SELECT {COLUMNS} FROM students WHERE student_id = ?",
+                                (student_id,)).fetchone()
+        return Student(*row) if row else None
+
+    # Writes, each one is a transaction
+
+    def insert_many(self, students):
+        """Add or replace a batch of students in one transaction"""
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO students ({COLUMNS}, total_score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (row_values(student) for student in students))
+
+    def replace_all(self, students):
+        """Make the table hold exactly these students"""
+        with self.conn:
+            self.conn.execute("DELETE FROM students")
+            self.conn.executemany(
+                f"INSERT INTO students ({COLUMNS}, total_score) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (row_values(student) for student in students))
+
+    def upsert(self, student):
+        self.insert_many([student])
+
+    def delete(self, student_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM students WHERE student_id = ?", (student_id,))
+
+    # Queries, answered by the database instead of a Python pass
+
+    def stats(self):
+        """Count, average, highest, passing percentage and grade counts"""
+        count, score_sum, best, passing = self.conn.execute(
+            "SELECT COUNT(*), SUM(total_score), MAX(total_score), "
+            "SUM(total_score >= ?) FROM students", (PASS_FLOOR,)).fetchone()
+        grade_counts = {grade: 0 for grade in "ABCDF"}
+        grade_counts.update(self.conn.execute(
+            f"SELECT {GRADE_CASE} AS grade, COUNT(*) FROM students GROUP BY grade"))
+        if not count:
+            return {'count': 0, 'average': 0, 'highest': 0, 'passing': 0,
+                    'grade_counts': grade_counts}
+        return {'count': count,
+                'average': (score_sum / count / 160) * 100,
+                'highest': (best / 160) * 100,
+                'passing': (passing / count) * 100,
+                'grade_counts': grade_counts}
+
+    def ordered_ids(self, key, descending=False):
+        """Student IDs in one of the table sort orders"""
+        return [row[0] for row in self.conn.execute(
+            f"SELECT student_id FROM students ORDER BY {order_clause(key, descending)}")]
+
+    def ordered(self, key, descending=False):
+        """Students in one of the table sort orders"""
+        rows = self.conn.execute(
+            f"SELECT {COLUMNS} FROM students ORDER BY {order_clause(key, descending)}")
+        return [Student(*row) for row in rows]
+
+    def top(self, n):
+        """Best n students, ties to the lower ID"""
+        rows = self.conn.execute(f"SELECT {COLUMNS} FROM students "
+                                 "ORDER BY total_score DESC, student_id LIMIT ?", (n,))
+        return [Student(*row) for row in rows]
+
+    def bottom(self, n):
+        """Worst n students, ties to the lower ID"""
+        rows = self.conn.execute(f"SELECT {COLUMNS} FROM students "
+                                 "ORDER BY total_score, student_id LIMIT ?", (n,))
+        return [Student(*row) for row in rows]
+
+    def highest(self):
+        students = self.top(1)
+        return students[0] if students else None
+
+    def lowest(self):
+        students = self.bottom(1)
+        return students[0] if students else None
+
+def order_clause(key, descending=False):
+    order = ORDER_BY[key]
+    if descending:
+        order = ", ".join(f"{part} DESC" for part in order.split(", "))
+    return order
+
+def open_store(path=SQLITE_DATA_FILE, seed=None):
+    """Open the database, filling a new one from seed batches if given
+
+    A new database is seeded under a temporary name and renamed into place
+    once every batch is in, so a failed seed never leaves a partial roster
+    that later launches would take as complete.
+    """
+    if seed is not None and not os.path.exists(path):
+        fd, temp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path) or ".")
+        os.close(fd)
+        try:
+            store = SQLiteStore(temp)
+            try:
+                for batch in seed:
+                    store.insert_many(batch)
+                count = len(store)
+            finally:
+                store.close()
+            os.replace(temp, path)
+        except BaseException:
+            os.remove(temp)
+            raise
+        print(f"Imported {count} student records into {path}")
+    return SQLiteStore(path)
@@ -0,0 +1,100 @@
+GRADES = ['A', 'B', 'C', 'D', 'F']
+PASS_PERCENTAGE = 40
+PERCENT_BUCKETS = 10  # 0-9%, 10-19% ... 90-100%
+MAX_TOTAL = 160  # Three coursework marks out of 20 and an exam out of 100
+
+def percent_bucket(percentage):
+    """Histogram bucket of a percentage, clamped so out-of-range marks land in an end bucket"""
+    return max(0, min(int(percentage * PERCENT_BUCKETS / 100), PERCENT_BUCKETS - 1))
+
+class StatsAggregator:
+    """Running roster statistics, updated one student at a time"""
+    def __init__(self, students=()):
+        self.count = 0
+        self.score_sum = 0
+        self.passing = 0
+        self.grade_counts = {grade: 0 for grade in GRADES}
+        self.percent_counts = [0] * PERCENT_BUCKETS
+
+        # What each student contributed when last counted, so edits and
+        # deletes can be undone without the old marks
+        self.counted = {}
+
+        # How many students have each total score, so the highest is a
+        # walk down at most MAX_TOTAL + 1 slots that deletes can't upset.
+        # Totals outside 0-MAX_TOTAL (hand-edited files) are counted apart.
+        self.total_counts = [0] * (MAX_TOTAL + 1)
+        self.other_totals = {}
+
+        for student in students:
+            self.add(student)
+
+    def add(self, student):
+        """Count a new student"""
+        total = student.total_score
+        grade = student.grade
+        passed = student.percentage >= PASS_PERCENTAGE
+        bucket = percent_bucket(student.percentage)
+
+        self.counted[student.student_id] = (total, grade, passed, bucket)
+        self.count += 1
+        self.score_sum += total
+        self.grade_counts[grade] += 1
+        self.percent_counts[bucket] += 1
+        if passed:
+            self.passing += 1
+        self.count_total(total, 1)
+
+    def remove(self, student):
+        """Stop counting a student"""
+        entry = self.counted.pop(student.student_id, None)
+        if entry is None:
+            return
+
+        total, grade, passed, bucket = entry
+        self.count -= 1
+        self.score_sum -= total
+        self.grade_counts[grade] -= 1
+        self.percent_counts[bucket] -= 1
+        if passed:
+            self.passing -= 1
+        self.count_total(total, -1)
+
+    def count_total(self, total, delta):
+        if 0 <= total <= MAX_TOTAL:
+            self.total_counts[total] += delta
+            return
+        count = self.other_totals.get(total, 0) + delta
+        if count:
+            self.other_totals[total] = count
+        else:
+            del self.other_totals[total]
+
+    def update(self, student):
+        """Recount a student whose marks changed"""
+        self.remove(student)
+        self.add(student)
+
+    @property
+    def average_percentage(self):
+        if not self.count:
+            return 0
+        return (self.score_sum / self.count / 160) * 100
+
+    @property
+    def highest_percentage(self):
+        best = max(self.other_totals, default=None)
+        if best is None or best < 0:
+            for total in range(MAX_TOTAL, -1, -1):
+                if self.total_counts[total]:
+                    best = total
+                    break
+        if best is None:
+            return 0
+        return (best / 160) * 100
+
+    @property
+    def passing_percentage(self):
+        if not self.count:
+            return 0
+        return (self.passing / self.count) * 100
@@ -1,29 +1,87 @@
 class Student:
+    __slots__ = ('student_id', 'name', '_mark1', '_mark2', '_mark3', '_exam_mark',
+                 '_coursework_total', '_total_score', '_percentage', '_grade')
+
     def __init__(self, student_id, name, mark1, mark2, mark3, exam_mark):
         self.student_id = int(student_id)
         self.name = name
-        self.mark1 = int(mark1)
-        self.mark2 = int(mark2)
-        self.mark3 = int(mark3)
-        self.exam_mark = int(exam_mark)
-    
+        self._mark1 = int(mark1)
+        self._mark2 = int(mark2)
+        self._mark3 = int(mark3)
+        self._exam_mark = int(exam_mark)
+        self._total_score = None
+
+    # Marks are set through properties so the cached scores get dropped
+
+    @property
+    def mark1(self):
+        return self._mark1
+
+    @mark1.setter
+    def mark1(self, value):
+        self._mark1 = int(value)
+        self._total_score = None
+
+    @property
+    def mark2(self):
+        return self._mark2
+
+    @mark2.setter
+    def mark2(self, value):
+        self._mark2 = int(value)
+        self._total_score = None
+
+    @property
+    def mark3(self):
+        return self._mark3
+
+    @mark3.setter
+    def mark3(self, value):
+        self._mark3 = int(value)
+        self._total_score = None
+
+    @property
+    def exam_mark(self):
+        return self._exam_mark
+
+    @exam_mark.setter
+    def exam_mark(self, value):
+        self._exam_mark = int(value)
+        self._total_score = None
+
+    def calculate_totals(self):
+        """Work out the derived scores once, until a mark changes"""
+        self._coursework_total = self._mark1 + self._mark2 + self._mark3
+        self._total_score = self._coursework_total + self._exam_mark
+        self._percentage = (self._total_score / 160) * 100
+
+        perc = self._percentage
+        if perc >= 70: self._grade = 'A'
+        elif perc >= 60: self._grade = 'B'
+        elif perc >= 50: self._grade = 'C'
+        elif perc >= 40: self._grade = 'D'
+        else: self._grade = 'F'
+
     @property
     def coursework_total(self):
-        return self.mark1 + self.mark2 + self.mark3
-    
+        if self._total_score is None:
+            self.calculate_totals()
+        return self._coursework_total
+
     @property
     def total_score(self):
-        return self.coursework_total + self.exam_mark
-    
+        if self._total_score is None:
+            self.calculate_totals()
+        return self._total_score
+
     @property
     def percentage(self):
-        return (self.total_score / 160) * 100
-    
+        if self._total_score is None:
+            self.calculate_totals()
+        return self._percentage
+
     @property
     def grade(self):
-        perc = self.percentage
-        if perc >= 70: return 'A'
-        elif perc >= 60: return 'B'
-        elif perc >= 50: return 'C'
-        elif perc >= 40: return 'D'
-        else: return 'F'
\ No newline at end of file
+        if self._total_score is None:
+            self.calculate_totals()
+        return self._grade
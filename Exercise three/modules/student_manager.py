@@ -1,34 +1,285 @@
+import os
+import queue
+import threading
 import tkinter as tk
+from tkinter import filedialog
 from .constants import *
 from .student import Student
-from .file_manager import load_students, save_students
+from .file_manager import iter_students, format_student, OP_ADD, OP_UPDATE, OP_DELETE
+from .file_watcher import FileWatcher, file_signature, to_line_hashes
+from .importer import import_csv, write_rejected_report
+from .stats import StatsAggregator, GRADES, PERCENT_BUCKETS, PASS_PERCENTAGE
+from .image_cache import load_image
+from .sorted_views import SortedViews, SORT_KEYS
+from .search_index import SearchIndex
+from .saver import Saver
+from . import timing
+from .timing import timed
 
 class StudentManager:
-    def __init__(self, root):
+    def __init__(self, root, preloader=None):
         self.root = root
+        self.preloader = preloader  # Warm-up started by the start screen, if any
         self.root.title("Student Manager")
         self.root.geometry(f"{WIDTH}x{HEIGHT}")
         self.root.resizable(False, False)
         
-        self.bg = self.load_image(BG_IMAGE, WIDTH, HEIGHT)
+        self.bg = load_image(BG_IMAGE, WIDTH, HEIGHT)
         self.selected_student = None
-        self.students = load_students()
+        self.students = []
+        self.stats = StatsAggregator()
+        self.by_id = {}  # student_id -> Student
+        self.sorted_views = SortedViews()
+        self.indexes_ready = True  # False while streaming, until the sorted views and search index are built
+        self.search_index = SearchIndex()
+        self.search_query = ""
+        self.search_timer = None
+        self.table_view = self.sorted_views.view("id")  # What the table shows, in order
+        self.msg_timer = None
+        self.msg_original = None
+        self.details_student = None  # Student in the details panel, if that is what it shows
+        self.dirty = set()  # Regions to redraw on the next idle pass
+        self.dirty_slots = set()  # Table pool rows to redraw when the whole table is not
+        self.render_job = None
         self.setup_ui()
+        self.setup_timing_overlay()
         
         # Add error notification system
         self.error_notification = None
         self.error_timer = None
+        
+        # Saves happen on a worker, flush them before the window goes
+        self.watcher = None
+        self.baseline = None  # Data file as the roster was read from it, see RosterData
+        self.saver = Saver(root, lambda: self.students,
+                        on_saved=self.show_msg, on_error=self.show_error_notification,
+                        on_rewritten=self.data_file_rewritten)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        self.start_loading()
 
-    def load_image(self, path, width, height):
-        """Load and resize image"""
-        try:
-            from PIL import Image, ImageTk
-            img = Image.open(path)
-            img = img.resize((width, height), Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception as e:
-            print(f"Error loading image {path}: {e}")
-            return None
+    def start_loading(self):
+        """Attach the preloaded roster, or stream it in if there is none"""
+        self.loading = True
+        
+        self.progress_label = tk.Label(self.canvas, text="Loading students... 0%",
+                                    bg=COLORS['content'], fg='black',
+                                    font=(FONT, FONT_SIZES['header'], 'bold'))
+        self.progress_window = self.canvas.create_window(
+            POS['list_x'], POS['list_y'] + POS['list_h'] / 2 + 15, window=self.progress_label)
+        
+        if self.preloader is not None:
+            self.poll_preloader()
+        else:
+            self.stream_students()
+
+    def poll_preloader(self):
+        """Wait for the start screen's warm-up, then take over its data"""
+        if not self.preloader.data_ready.is_set():
+            self.progress_label.config(text=f"Loading students... {self.preloader.progress * 100:.0f}%")
+            self.root.after(LOAD['poll_ms'], self.poll_preloader)
+            return
+        
+        data = self.preloader.data
+        self.preloader = None
+        if data is None:
+            # Warm-up failed, fall back to loading here
+            self.stream_students()
+            return
+        
+        self.students = data.students
+        self.by_id = data.by_id
+        self.stats = data.stats
+        self.sorted_views = data.sorted_views
+        self.search_index = data.search_index
+        self.baseline = data.baseline
+        
+        self.mark_dirty('view', 'stats')
+        self.finish_loading()
+
+    def stream_students(self):
+        """Parse the data file on a worker thread and fill the UI as it arrives"""
+        self.load_queue = queue.Queue()
+        
+        def report(bytes_read, total_bytes):
+            fraction = bytes_read / total_bytes if total_bytes else 1
+            self.load_queue.put(('progress', fraction))
+        
+        def worker():
+            students = []
+            signature = file_signature(DATA_FILE)
+            hashes = {}
+            try:
+                with timing.span("load_students"):
+                    for batch in iter_students(progress=report, line_hashes=hashes):
+                        students.extend(batch)
+                        self.load_queue.put(('batch', batch))
+            except FileNotFoundError:
+                print(f"File not found at: {DATA_FILE}")
+            except Exception as e:
+                print(f"Error loading data: {e}")
+            
+            # One sort per order and of the search tokens for the whole
+            # roster, here rather than a merge per batch on the Tk thread
+            self.load_queue.put(('indexes', (SortedViews(students), SearchIndex(students))))
+            self.load_queue.put(('baseline', (signature, to_line_hashes(hashes))))
+            self.load_queue.put(('done', None))
+        
+        # The table shows students in file order, unfiltered, until the indexes arrive
+        self.indexes_ready = False
+        self.table_view = self.students
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(LOAD['poll_ms'], self.poll_loading)
+
+    def poll_loading(self):
+        """Move loaded batches from the worker into the table and stats"""
+        batches = 0
+        done = False
+        
+        while batches < LOAD['batches_per_tick']:
+            try:
+                kind, payload = self.load_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'batch':
+                self.students.extend(payload)
+                self.track_loaded(payload)
+                batches += 1
+            elif kind == 'indexes':
+                self.sorted_views, self.search_index = payload
+                self.indexes_ready = True
+                self.mark_dirty('view')
+            elif kind == 'baseline':
+                self.baseline = payload
+            elif kind == 'progress':
+                self.progress_label.config(text=f"Loading students... {payload * 100:.0f}%")
+            else:
+                done = True
+                break
+        
+        if batches:
+            self.mark_dirty('table', 'stats')
+        
+        if done:
+            self.finish_loading()
+        else:
+            self.root.after(LOAD['poll_ms'], self.poll_loading)
+
+    def finish_loading(self):
+        """Drop the progress indicator once every batch is in"""
+        self.loading = False
+        self.canvas.delete(self.progress_window)
+        self.progress_label.destroy()
+        print(f"Loaded {len(self.students)} student records")
+        
+        # Pick up edits other programs make to the data file
+        if WATCH['enabled'] and STORAGE_FORMAT == 'text':
+            self.watcher = FileWatcher(self.root, self.apply_file_changes, baseline=self.baseline)
+
+    def data_file_rewritten(self, signature, base):
+        """Our own save replaced the data file, don't read it back as outside changes"""
+        if self.watcher is not None:
+            self.watcher.rebase(signature, base)
+
+    def apply_file_changes(self, changes):
+        """Merge records another program changed in the data file"""
+        if self.loading:
+            # An import is merging, come back when it is done
+            self.root.after(LOAD['poll_ms'], lambda: self.apply_file_changes(changes))
+            return
+        
+        applied = 0
+        for student_id, new in changes:
+            current = self.by_id.get(student_id)
+            
+            if new is None:
+                if current is None:
+                    continue
+                old_row = self.row_in_view(current)
+                self.students.remove(current)
+                self.track_removed(current)
+                if self.selected_student is current:
+                    self.selected_student = None
+                self.patch_rows(old_row, None)
+                op, student = OP_DELETE, current
+            elif current is None:
+                self.students.append(new)
+                self.track_added(new)
+                self.patch_rows(None, self.row_in_view(new))
+                op, student = OP_ADD, new
+            elif format_student(current) != format_student(new):
+                # Update in place so selection and open panels keep the same object
+                old_row = self.row_in_view(current)
+                current.name = new.name
+                current.mark1, current.mark2, current.mark3 = new.mark1, new.mark2, new.mark3
+                current.exam_mark = new.exam_mark
+                self.track_updated(current)
+                self.patch_rows(old_row, self.row_in_view(current))
+                op, student = OP_UPDATE, current
+            else:
+                # Already what we have, usually our own write
+                continue
+            
+            # The file has it already, unless our journal would replay over it
+            if self.saver.overrides(student_id):
+                self.saver.change(op, student)
+            applied += 1
+        
+        if applied:
+            print(f"Applied {applied} changes from {DATA_FILE}")
+            self.mark_dirty('stats', 'details')
+            # After the redraw, which resets the details title
+            self.root.after_idle(lambda: self.show_msg(f"Reloaded {applied} changed records"))
+
+    def track_added(self, student):
+        """Add a student to the indexes kept alongside self.students"""
+        self.by_id[student.student_id] = student
+        self.stats.add(student)
+        self.sorted_views.add(student)
+        self.search_index.add(student)
+
+    def track_loaded(self, students):
+        """Add a batch streamed in at startup, the loader builds the other indexes"""
+        for student in students:
+            self.by_id[student.student_id] = student
+            self.stats.add(student)
+
+    def track_added_many(self, students):
+        """Add an imported batch to the indexes"""
+        for student in students:
+            self.by_id[student.student_id] = student
+            self.stats.add(student)
+        self.sorted_views.add_many(students)
+        self.search_index.add_many(students)
+
+    def track_updated(self, student):
+        """Refresh the indexes after a student's name or marks changed"""
+        self.stats.update(student)
+        self.sorted_views.update(student)
+        self.search_index.update(student)
+
+    def track_removed(self, student):
+        """Drop a student from the indexes"""
+        self.by_id.pop(student.student_id, None)
+        self.stats.remove(student)
+        self.sorted_views.remove(student)
+        self.search_index.remove(student)
+
+    def check_loaded(self):
+        """Block changes until the whole roster is in memory"""
+        if self.loading:
+            self.show_error_notification("Please wait, students are still loading")
+            return False
+        return True
+
+    def check_current(self, student):
+        """Block changes to a student the data file watcher has removed"""
+        if self.by_id.get(student.student_id) is not student:
+            self.show_empty()
+            self.show_error_notification("Error: This student was removed from the data file")
+            return False
+        return True
 
     def setup_ui(self):
         """Setup UI"""
@@ -39,6 +290,7 @@ class StudentManager:
             self.canvas.create_image(0, 0, image=self.bg, anchor="nw")
         
         self.setup_title()
+        self.setup_distribution()
         self.setup_stats()
         self.setup_buttons()
         self.setup_student_list()
@@ -114,39 +366,135 @@ class StudentManager:
             self.error_timer = None
 
     def setup_stats(self):
-        """Create stats with real data"""
-        total = len(self.students)
-        
-        if total > 0:
-            avg_percentage = sum(s.percentage for s in self.students) / total
-            highest_percentage = max(s.percentage for s in self.students)
-            passing = sum(1 for s in self.students if s.percentage >= 40)
-            a_plus = sum(1 for s in self.students if s.grade == 'A')
-            f_count = sum(1 for s in self.students if s.grade == 'F')
-            
-            passing_percentage = (passing / total) * 100
-        else:
-            avg_percentage = highest_percentage = passing_percentage = 0
-            a_plus = f_count = 0
-        
-        stats = [
-            ("Students", str(total)),
-            ("Average", f"{avg_percentage:.1f}%"),
-            ("Highest", f"{highest_percentage:.1f}%"),
-            ("Passing", f"{passing_percentage:.1f}%"),
-            ("A+", str(a_plus)),
-            ("F", str(f_count))
-        ]
+        """Create stats bar, values are filled in by update_stats_display"""
+        labels = ["Students", "Average", "Highest", "Passing", "A+", "F"]
+        self.stat_values = {}
         
-        for i, (label, value) in enumerate(stats):
+        for i, label in enumerate(labels):
             x = 120 + (i * 200)
             frame = tk.Frame(self.canvas, bg=COLORS['content'])
             self.canvas.create_window(x, POS['stats_y'], window=frame)
             
             tk.Label(frame, text=label, bg=COLORS['content'],
                     fg='black', font=(FONT, FONT_SIZES['stats_label'], 'bold')).pack()
-            tk.Label(frame, text=value, bg=COLORS['content'],
-                    fg='black', font=(FONT, FONT_SIZES['stats_value'])).pack()
+            value = tk.Label(frame, text="", bg=COLORS['content'],
+                    fg='black', font=(FONT, FONT_SIZES['stats_value']))
+            value.pack()
+            self.stat_values[label] = value
+        
+        self.update_stats_display()
+
+    def update_stats_display(self):
+        """Show the running stats without rescanning the roster"""
+        stats = self.stats
+        values = {
+            "Students": str(stats.count),
+            "Average": f"{stats.average_percentage:.1f}%",
+            "Highest": f"{stats.highest_percentage:.1f}%",
+            "Passing": f"{stats.passing_percentage:.1f}%",
+            "A+": str(stats.grade_counts['A']),
+            "F": str(stats.grade_counts['F'])
+        }
+        
+        for label, value in values.items():
+            self.stat_values[label].config(text=value)
+        
+        self.update_distribution()
+
+    def setup_distribution(self):
+        """Draw the grade and percentage histograms, bars are sized by update_distribution"""
+        d = DISTRIBUTION
+        self.canvas.create_rectangle(d['x'], d['y'], d['x'] + d['w'], d['y'] + d['h'],
+                                    fill=COLORS['content'], outline='')
+        self.dist_top = d['y'] + 28
+        self.dist_bottom = d['y'] + d['h'] - 14
+        
+        percent_labels = [f"{i * 10}-{i * 10 + 9}" for i in range(PERCENT_BUCKETS - 1)] + ["90+"]
+        charts = [
+            ("grades", "Grades", GRADES, d['x'] + 10, d['x'] + d['grade_w']),
+            ("percent", "Percentage", percent_labels, d['x'] + d['grade_w'] + 30, d['x'] + d['w'] - 10)
+        ]
+        
+        self.dist_bars = {}  # chart -> [(bar, count text, left, right)]
+        for chart, title, labels, left, right in charts:
+            self.canvas.create_text(left, d['y'] + 10, text=title, anchor='w', fill='black',
+                                    font=(FONT, FONT_SIZES['header'], 'bold'))
+            slot = (right - left) / len(labels)
+            bars = []
+            
+            for i, label in enumerate(labels):
+                bar_left, bar_right = left + i * slot + 3, left + (i + 1) * slot - 3
+                fail = chart == "percent" and i * 100 / PERCENT_BUCKETS < PASS_PERCENTAGE
+                bar = self.canvas.create_rectangle(bar_left, self.dist_bottom, bar_right, self.dist_bottom,
+                                                fill=d['fail_color'] if fail else d['bar_color'], outline='')
+                count = self.canvas.create_text((bar_left + bar_right) / 2, self.dist_bottom, text="",
+                                                anchor='s', fill='black', font=(FONT, FONT_SIZES['cell']))
+                self.canvas.create_text((bar_left + bar_right) / 2, d['y'] + d['h'] - 6, text=label,
+                                        fill='black', font=(FONT, FONT_SIZES['cell']))
+                bars.append((bar, count, bar_left, bar_right))
+            
+            self.dist_bars[chart] = bars
+
+    def update_distribution(self):
+        """Resize the histogram bars from the running bucket counts"""
+        charts = [
+            ("grades", [self.stats.grade_counts[grade] for grade in GRADES]),
+            ("percent", self.stats.percent_counts)
+        ]
+        
+        for chart, counts in charts:
+            tallest = max(counts) or 1
+            for (bar, count_text, left, right), count in zip(self.dist_bars[chart], counts):
+                top = self.dist_bottom - (self.dist_bottom - self.dist_top) * count / tallest
+                self.canvas.coords(bar, left, top, right, self.dist_bottom)
+                self.canvas.coords(count_text, (left + right) / 2, top - 1)
+                self.canvas.itemconfig(count_text, text=str(count) if count else "")
+
+    def setup_timing_overlay(self):
+        """F12 toggles the timing overlay, Ctrl+F12 dumps timings to a file"""
+        self.timing_label = None
+        self.timing_timer = None
+        self.root.bind('<F12>', lambda e: self.toggle_timing_overlay())
+        self.root.bind('<Control-F12>', lambda e: self.dump_timings())
+
+    def toggle_timing_overlay(self):
+        """Show or hide the last/p95 span timings, collecting while shown"""
+        if self.timing_label:
+            if self.timing_timer:
+                self.root.after_cancel(self.timing_timer)
+                self.timing_timer = None
+            self.canvas.delete(self.timing_window)
+            self.timing_label.destroy()
+            self.timing_label = None
+            timing.set_enabled(TIMING['enabled'])
+            return
+        
+        timing.set_enabled(True)
+        self.timing_label = tk.Label(self.canvas, text="", bg='black', fg='#00ff00',
+                                    font=('Courier', 9), justify='left', anchor='nw')
+        self.timing_window = self.canvas.create_window(10, 10, window=self.timing_label, anchor='nw')
+        self.update_timing_overlay()
+
+    def update_timing_overlay(self):
+        """Redraw the overlay every TIMING['overlay_ms'] while it is open"""
+        lines = [f"{'span':<22}{'last':>9}{'p95':>9}{'n':>5}"]
+        for name, span in sorted(timing.summary().items()):
+            lines.append(f"{name:<22}{span['last']:>7.1f}ms{span['p95']:>7.1f}ms{span['count']:>5}")
+        if len(lines) == 1:
+            lines.append("no timings yet")
+        
+        self.timing_label.config(text="\n".join(lines))
+        self.timing_timer = self.root.after(TIMING['overlay_ms'], self.update_timing_overlay)
+
+    def dump_timings(self):
+        """Write the collected timings to TIMING['dump_file']"""
+        try:
+            path = timing.dump()
+        except OSError as e:
+            self.show_error_notification(f"Error: Could not save timings ({e})")
+            return
+        print(f"Timings written to {path}")
+        self.show_msg(f"Timings saved to {os.path.basename(path)}")
 
     def create_btn(self, text, cmd, x, y):
         """Create button with hover effects"""
@@ -174,6 +522,10 @@ class StudentManager:
         for i, (text, cmd) in enumerate(buttons):
             x = POSITIONS[i]
             self.create_btn(text, cmd, x, POS['buttons_y'])
+        
+        # Second row, above the details panel
+        self.create_btn("Import CSV", self.import_students, POS['import_x'], POS['extra_buttons_y'])
+        self.create_btn("Leaderboard", self.show_leaderboard, POS['leaderboard_x'], POS['extra_buttons_y'])
 
     def setup_student_list(self):
         """Setup student list in spreadsheet style"""
@@ -182,6 +534,24 @@ class StudentManager:
         self.canvas.create_window(POS['list_x'], POS['list_y'], window=main_frame, 
                                 width=POS['list_w'], height=POS['list_h'])
         
+        # Search box above the sorting controls
+        search_frame = tk.Frame(main_frame, bg=COLORS['content'])
+        search_frame.pack(fill='x', pady=(5, 0))
+        
+        tk.Label(search_frame, text="Search:", bg=COLORS['content'],
+                fg='black', font=(FONT, FONT_SIZES['header'], 'bold')).pack(side='left', padx=(10, 5))
+        
+        self.search_entry = tk.Entry(search_frame, font=(FONT, FONT_SIZES['cell']))
+        self.search_entry.pack(side='left', fill='x', expand=True)
+        self.search_entry.bind('<KeyRelease>', lambda e: self.schedule_search())
+        
+        clear_btn = tk.Label(search_frame, text="✕", bg=COLORS['content'], fg='black',
+                            font=(FONT, FONT_SIZES['header'], 'bold'), cursor='hand2')
+        clear_btn.pack(side='left', padx=(5, 10))
+        clear_btn.bind('<Button-1>', lambda e: self.clear_search())
+        clear_btn.bind('<Enter>', lambda e: clear_btn.config(bg=COLORS['hover']))
+        clear_btn.bind('<Leave>', lambda e: clear_btn.config(bg=COLORS['content']))
+        
         # Add sorting controls at the top
         sort_frame = tk.Frame(main_frame, bg=COLORS['content'])
         sort_frame.pack(fill='x', pady=(0, 5))
@@ -209,7 +579,35 @@ class StudentManager:
         perc_radio = tk.Radiobutton(sort_frame, text="Percentage", variable=self.sort_var,
                                 value="percentage", bg=COLORS['content'], fg='black',
                                 font=(FONT, FONT_SIZES['cell']), command=self.apply_sorting)
-        perc_radio.pack(side='left')
+        perc_radio.pack(side='left', padx=(0, 15))
+        
+        # Grade then name
+        grade_radio = tk.Radiobutton(sort_frame, text="Grade", variable=self.sort_var,
+                                value="grade", bg=COLORS['content'], fg='black',
+                                font=(FONT, FONT_SIZES['cell']), command=self.apply_sorting)
+        grade_radio.pack(side='left', padx=(0, 15))
+        
+        # Reverse any of the above
+        self.descending_var = tk.BooleanVar(value=False)
+        desc_check = tk.Checkbutton(sort_frame, text="Desc", variable=self.descending_var,
+                                bg=COLORS['content'], fg='black',
+                                font=(FONT, FONT_SIZES['cell']), command=self.apply_sorting)
+        desc_check.pack(side='left')
+        
+        # Jump to a student by ID
+        go_btn = tk.Label(sort_frame, text="Go", bg=COLORS['button'], fg='black',
+                        font=(FONT, FONT_SIZES['header'], 'bold'), cursor='hand2', padx=6)
+        go_btn.pack(side='right', padx=(5, 10))
+        go_btn.bind('<Button-1>', lambda e: self.jump_to_student())
+        go_btn.bind('<Enter>', lambda e: go_btn.config(bg=COLORS['hover']))
+        go_btn.bind('<Leave>', lambda e: go_btn.config(bg=COLORS['button']))
+        
+        self.jump_entry = tk.Entry(sort_frame, font=(FONT, FONT_SIZES['cell']), width=8)
+        self.jump_entry.pack(side='right')
+        self.jump_entry.bind('<Return>', lambda e: self.jump_to_student())
+        
+        tk.Label(sort_frame, text="Go to ID:", bg=COLORS['content'],
+                fg='black', font=(FONT, FONT_SIZES['header'], 'bold')).pack(side='right', padx=(0, 5))
         
         # Create frame for student list (with scrollbars)
         list_frame = tk.Frame(main_frame, bg=COLORS['content'])
@@ -218,8 +616,8 @@ class StudentManager:
         # Create canvas with scrollbars for the list
         list_canvas = tk.Canvas(list_frame, bg=COLORS['content'], highlightthickness=0)
         
-        # Vertical scrollbar
-        v_scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=list_canvas.yview)
+        # Vertical scrollbar drives the row window, not the canvas
+        self.v_scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=self.scroll_table)
         
         # Horizontal scrollbar
         h_scrollbar = tk.Scrollbar(list_frame, orient="horizontal", command=list_canvas.xview)
@@ -234,14 +632,11 @@ class StudentManager:
         )
         
         list_canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        list_canvas.configure(
-            yscrollcommand=v_scrollbar.set,
-            xscrollcommand=h_scrollbar.set
-        )
+        list_canvas.configure(xscrollcommand=h_scrollbar.set)
         
         # Pack the canvas and scrollbars
         list_canvas.grid(row=0, column=0, sticky='nsew')
-        v_scrollbar.grid(row=0, column=1, sticky='ns')
+        self.v_scrollbar.grid(row=0, column=1, sticky='ns')
         h_scrollbar.grid(row=1, column=0, sticky='ew')
         
         # Configure grid weights for proper resizing
@@ -255,87 +650,258 @@ class StudentManager:
                             width=TABLE['col_w'], relief='ridge')
             label.grid(row=0, column=col, sticky='ew', padx=1, pady=1)
         
-        self.student_rows = {}  # Store row widgets by student
+        # Mouse wheel scrolls the row window too
+        self.scrollable_frame.bind('<MouseWheel>', self.wheel_table)
+        self.scrollable_frame.bind('<Button-4>', self.wheel_table)
+        self.scrollable_frame.bind('<Button-5>', self.wheel_table)
+        
+        self.first_row = 0  # Index in self.table_view shown in the top pool row
+        self.row_pool = []  # Fixed set of row widgets, rebound as we scroll
+        self.row_students = []  # Student currently shown in each pool row
+        self.slot_of = {}  # Row label -> pool row it belongs to
+        self.selected_slot = None  # Pool row painted as selected
+        self.hovered_slot = None  # Pool row under the mouse
+        self.build_row_pool()
         self.refresh_student_list()
 
-    def refresh_student_list(self):
-        """Refresh the student list with current data"""
-        # Clear existing student rows
-        for row_widgets in self.student_rows.values():
-            for widget in row_widgets:
-                widget.destroy()
-        self.student_rows.clear()
-        
-        # Add student rows
-        for row, student in enumerate(self.students, start=1):
-            student_data = [
-                student.student_id, student.name, student.mark1, student.mark2,
-                student.mark3, student.coursework_total, student.exam_mark,
-                student.total_score, student.grade
-            ]
-            
-            # Store labels for this row to highlight together
+    def build_row_pool(self):
+        """Create the fixed pool of row widgets once"""
+        # One set of handlers for every cell, found through a shared bind tag
+        for sequence, handler in [('<Button-1>', self.on_row_click), ('<Enter>', self.on_row_enter),
+                                  ('<Leave>', self.on_row_leave), ('<MouseWheel>', self.wheel_table),
+                                  ('<Button-4>', self.wheel_table), ('<Button-5>', self.wheel_table)]:
+            self.root.bind_class(TABLE['row_tag'], sequence, handler)
+        
+        for slot in range(TABLE['pool_rows']):
             row_labels = []
             
-            for col, data in enumerate(student_data):
-                label = tk.Label(self.scrollable_frame, text=str(data), 
+            for col in range(len(TABLE['headers'])):
+                label = tk.Label(self.scrollable_frame, text="", 
                             bg=COLORS['content'], fg='black', font=(FONT, FONT_SIZES['cell']),
                             width=TABLE['col_w'], relief='solid', cursor='hand2')
-                label.grid(row=row, column=col, sticky='ew', padx=1, pady=1)
-                
-                # Bind click event to select student
-                label.bind('<Button-1>', lambda e, s=student: self.select_student(s))
-                label.bind('<Enter>', lambda e, lbl=label: self.hover_label(lbl, True))
-                label.bind('<Leave>', lambda e, lbl=label: self.hover_label(lbl, False))
+                label.grid(row=slot + 1, column=col, sticky='ew', padx=1, pady=1)
+                label.bindtags((TABLE['row_tag'],) + tuple(label.bindtags()))
                 
+                self.slot_of[label] = slot
                 row_labels.append(label)
             
-            self.student_rows[student] = row_labels
-        
-        # Re-highlight selected student if any
-        if self.selected_student and self.selected_student in self.student_rows:
-            self.highlight_student_row(self.selected_student)
-
-    def hover_label(self, label, is_hovering):
-        """Handle label hover effects"""
-        if is_hovering and label not in self.student_rows.get(self.selected_student, []):
-            label.config(bg=COLORS['hover'])
-        elif not is_hovering and label not in self.student_rows.get(self.selected_student, []):
-            label.config(bg=COLORS['content'])
-
-    def highlight_student_row(self, student):
-        """Highlight a student's row"""
-        # Clear previous highlights
-        for row_widgets in self.student_rows.values():
-            for widget in row_widgets:
-                widget.config(bg=COLORS['content'])
-        
-        # Highlight selected student
-        if student in self.student_rows:
-            for label in self.student_rows[student]:
-                label.config(bg=TABLE['select_color'])
+            self.row_pool.append(row_labels)
+            self.row_students.append(None)
+
+    @timed()
+    def refresh_student_list(self):
+        """Refresh the student list with current data"""
+        # Keep the window inside the data after deletes
+        max_first = max(0, len(self.table_view) - TABLE['pool_rows'])
+        self.first_row = min(self.first_row, max_first)
+        
+        self.render_rows()
+        self.update_scrollbar()
+
+    def render_rows(self):
+        """Bind the pool rows to the students in the current window"""
+        for slot in range(len(self.row_pool)):
+            self.render_slot(slot)
+
+    def render_slot(self, slot):
+        """Bind one pool row to the student at its position in the view"""
+        row_labels = self.row_pool[slot]
+        index = self.first_row + slot
+        
+        if index >= len(self.table_view):
+            # Nothing to show, hide the spare row
+            self.row_students[slot] = None
+            if self.selected_slot == slot:
+                self.selected_slot = None
+            for label in row_labels:
+                label.grid_remove()
+            return
+        
+        student = self.table_view[index]
+        self.row_students[slot] = student
+        student_data = [
+            student.student_id, student.name, student.mark1, student.mark2,
+            student.mark3, student.coursework_total, student.exam_mark,
+            student.total_score, student.grade
+        ]
+        
+        if student is self.selected_student:
+            self.selected_slot = slot
+        elif self.selected_slot == slot:
+            self.selected_slot = None
+        
+        bg = self.row_color(slot)
+        for label, data in zip(row_labels, student_data):
+            label.config(text=str(data), bg=bg)
+            label.grid()
+
+    def update_scrollbar(self):
+        """Sync the scrollbar slider with the row window"""
+        total = len(self.table_view)
+        if total <= TABLE['pool_rows']:
+            self.v_scrollbar.set(0, 1)
+        else:
+            self.v_scrollbar.set(self.first_row / total,
+                                (self.first_row + TABLE['pool_rows']) / total)
+
+    def scroll_table(self, action, amount, unit=None):
+        """Handle scrollbar commands by moving the row window"""
+        total = len(self.table_view)
+        
+        if action == "moveto":
+            first = int(float(amount) * total)
+        elif unit == "pages":
+            first = self.first_row + int(amount) * TABLE['pool_rows']
+        else:
+            first = self.first_row + int(amount)
+        
+        self.scroll_to_row(first)
+
+    def wheel_table(self, event):
+        """Scroll the row window with the mouse wheel"""
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to_row(self.first_row - 3)
+        else:
+            self.scroll_to_row(self.first_row + 3)
+
+    def scroll_to_row(self, first):
+        """Move the row window so it starts at the given index"""
+        max_first = max(0, len(self.table_view) - TABLE['pool_rows'])
+        first = max(0, min(first, max_first))
+        
+        if first != self.first_row:
+            self.first_row = first
+            self.mark_dirty('table')
+
+    def row_color(self, slot):
+        """Background for a pool row: selected, hovered or plain"""
+        student = self.row_students[slot]
+        if student is not None and student is self.selected_student:
+            return TABLE['select_color']
+        if slot == self.hovered_slot and student is not None:
+            return COLORS['hover']
+        return COLORS['content']
+
+    def paint_row(self, slot):
+        """Recolour one pool row"""
+        if slot is None:
+            return
+        bg = self.row_color(slot)
+        for label in self.row_pool[slot]:
+            label.config(bg=bg)
+
+    def on_row_click(self, event):
+        """Select the student shown in the clicked row"""
+        student = self.row_students[self.slot_of[event.widget]]
+        if student is not None:
+            self.select_student(student)
+
+    def on_row_enter(self, event):
+        """Hover the row under the mouse"""
+        slot = self.slot_of[event.widget]
+        if slot != self.hovered_slot:
+            previous, self.hovered_slot = self.hovered_slot, slot
+            self.paint_row(previous)
+            self.paint_row(slot)
+
+    def on_row_leave(self, event):
+        """Drop the hover when the mouse leaves a row"""
+        slot = self.slot_of[event.widget]
+        if slot == self.hovered_slot:
+            self.hovered_slot = None
+            self.paint_row(slot)
 
     def select_student(self, student):
-        """Select a student from the list"""
+        """Select a student, only the old and new rows are repainted"""
+        previous = self.selected_slot
         self.selected_student = student
-        self.highlight_student_row(student)
+        if 'table' in self.dirty or 'view' in self.dirty:
+            return  # The pending redraw paints the selection
+        
+        row = self.row_in_view(student)
+        slot = row - self.first_row if row is not None else None
+        self.selected_slot = slot if slot is not None and 0 <= slot < TABLE['pool_rows'] else None
+        
+        if self.dirty_slots:
+            # Rows are about to be patched, paint with them
+            self.dirty_slots.update(s for s in (previous, self.selected_slot) if s is not None)
+            return
+        if previous != self.selected_slot:
+            self.paint_row(previous)
+        self.paint_row(self.selected_slot)
 
+    def jump_to_student(self):
+        """Select and scroll to the student with the entered ID"""
+        if not self.check_loaded():
+            return
+        try:
+            student_id = int(self.jump_entry.get().strip())
+        except ValueError:
+            self.show_error_notification("Error: Please enter a valid student ID")
+            return
+        
+        student = self.by_id.get(student_id)
+        if student is None:
+            self.show_error_notification(f"Error: No student with ID {student_id}")
+            return
+        
+        self.open_student(student)
+
+    @timed()
     def apply_sorting(self):
-        """Apply sorting based on selected radio button"""
-        sort_by = self.sort_var.get()
+        """Switch the table to the order picked in the sort controls"""
+        self.update_view()
         
-        if sort_by == "id":
-            self.students.sort(key=lambda s: s.student_id)
-        elif sort_by == "name":
-            self.students.sort(key=lambda s: s.name.lower())
-        elif sort_by == "percentage":
-            self.students.sort(key=lambda s: s.percentage)
+        # Keep the selected student in sight in the new order
+        row = self.row_in_view(self.selected_student)
+        if row is not None:
+            self.first_row = max(0, row - TABLE['pool_rows'] // 2)
+        else:
+            self.first_row = 0
         
-        self.refresh_student_list()
+        self.mark_dirty('table')
+
+    def update_view(self):
+        """Point self.table_view at the current sort order, filtered by any search"""
+        sort_by = self.sort_var.get()
+        descending = self.descending_var.get()
         
-        # Clear selection since order changed
-        self.selected_student = None
-        self.highlight_student_row(None)
+        if not self.indexes_ready:
+            self.table_view = self.students
+        elif self.search_query:
+            matches = [self.by_id[i] for i in self.search_index.search(self.search_query)]
+            self.table_view = sorted(matches, key=SORT_KEYS[sort_by], reverse=descending)
+        else:
+            self.table_view = self.sorted_views.view(sort_by, descending)
+
+    def row_in_view(self, student):
+        """Row of a student in the current view, None if not shown"""
+        if student is None:
+            return None
+        try:
+            return self.table_view.index(student)
+        except (KeyError, ValueError):
+            return None
+
+    def schedule_search(self):
+        """Run the search once typing pauses"""
+        if self.search_timer:
+            self.root.after_cancel(self.search_timer)
+        self.search_timer = self.root.after(SEARCH['debounce_ms'], self.apply_search)
+
+    def apply_search(self):
+        """Show only the students matching the search box"""
+        self.search_timer = None
+        query = self.search_entry.get().strip()
+        if query == self.search_query:
+            return
+        self.search_query = query
+        self.apply_sorting()
+
+    def clear_search(self):
+        """Empty the search box and show everyone again"""
+        self.search_entry.delete(0, tk.END)
+        self.apply_search()
 
     def setup_details(self):
         """Setup details panel"""
@@ -351,42 +917,75 @@ class StudentManager:
         self.content = tk.Frame(self.detail_frame, bg=COLORS['content'])
         self.content.pack(fill='both', expand=True, padx=20)
         
+        # Each panel is built the first time it is shown, then only refilled
+        self.panel_builders = {
+            'details': self.build_details_panel,
+            'add': self.build_add_panel,
+            'edit': self.build_edit_panel,
+            'delete': self.build_delete_panel,
+            'leaderboard': self.build_leaderboard_panel
+        }
+        self.panels = {}
+        self.current_panel = None
+        
         self.show_empty()
 
-    def show_details(self, student):
-        """Show student details"""
-        for w in self.content.winfo_children():
-            w.destroy()
-        self.title.config(text="Student Details")
-        
-        info = [
-            ("ID:", student.student_id), ("Name:", student.name),
-            ("CW1:", f"{student.mark1}/20"), ("CW2:", f"{student.mark2}/20"),
-            ("CW3:", f"{student.mark3}/20"), ("CW Total:", f"{student.coursework_total}/60"),
-            ("Exam:", f"{student.exam_mark}/100"), ("Total:", f"{student.total_score}/160"),
-            ("Percentage:", f"{student.percentage:.1f}%"), ("Grade:", student.grade)
-        ]
-        
-        for label, value in info:
-            row = tk.Frame(self.content, bg=COLORS['content'])
+    def show_panel(self, name):
+        """Swap the cached panel into the details area"""
+        panel = self.panels.get(name)
+        if panel is None:
+            panel = self.panels[name] = self.panel_builders[name]()
+        
+        if self.current_panel is not panel:
+            if self.current_panel is not None:
+                self.current_panel.pack_forget()
+            panel.pack(fill='both', expand=True)
+            self.current_panel = panel
+        
+        if name != 'details':
+            self.details_student = None
+
+    def build_details_panel(self):
+        """Label/value rows, values are filled in by show_details"""
+        panel = tk.Frame(self.content, bg=COLORS['content'])
+        self.detail_values = []
+        
+        for label in ["ID:", "Name:", "CW1:", "CW2:", "CW3:", "CW Total:",
+                      "Exam:", "Total:", "Percentage:", "Grade:"]:
+            row = tk.Frame(panel, bg=COLORS['content'])
             row.pack(fill='x', pady=2)
             
             tk.Label(row, text=label, bg=COLORS['content'], fg='black',
                     font=(FONT, FONT_SIZES['detail_label'], 'bold'), width=12, anchor='w').pack(side='left')
-            tk.Label(row, text=value, bg=COLORS['content'], fg='black',
-                    font=(FONT, FONT_SIZES['detail_value']), anchor='w').pack(side='left')
-
-    def add(self):
-        self.title.config(text="Add Student")
+            value = tk.Label(row, text="", bg=COLORS['content'], fg='black',
+                    font=(FONT, FONT_SIZES['detail_value']), anchor='w')
+            value.pack(side='left')
+            self.detail_values.append(value)
         
-        for w in self.content.winfo_children():
-            w.destroy()
+        return panel
+
+    @timed()
+    def show_details(self, student):
+        """Show student details"""
+        self.show_panel('details')
+        self.details_student = student
+        self.title.config(text="Student Details")
         
-        scroll_frame = tk.Frame(self.content, bg=COLORS['content'])
-        scroll_frame.pack(fill='both', expand=True)
+        values = [
+            student.student_id, student.name,
+            f"{student.mark1}/20", f"{student.mark2}/20",
+            f"{student.mark3}/20", f"{student.coursework_total}/60",
+            f"{student.exam_mark}/100", f"{student.total_score}/160",
+            f"{student.percentage:.1f}%", student.grade
+        ]
         
-        canvas = tk.Canvas(scroll_frame, bg=COLORS['content'], highlightthickness=0)
-        scrollbar = tk.Scrollbar(scroll_frame, orient="vertical", command=canvas.yview)
+        for label, value in zip(self.detail_values, values):
+            label.config(text=value)
+
+    def build_form_frame(self, panel):
+        """Scrollable frame for a form inside a panel"""
+        canvas = tk.Canvas(panel, bg=COLORS['content'], highlightthickness=0)
+        scrollbar = tk.Scrollbar(panel, orient="vertical", command=canvas.yview)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -402,52 +1001,60 @@ class StudentManager:
         
         canvas.bind("<Configure>", 
             lambda e: canvas.itemconfig(canvas_window, width=e.width))
+        return form_frame
 
-        self.fields = {}
-        
-        tk.Label(form_frame, text="Student ID:", bg=COLORS['content'],
-                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        id_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-        id_entry.pack(fill='x', pady=(0, 10))
-        self.fields['id'] = id_entry
-        
-        tk.Label(form_frame, text="Name:", bg=COLORS['content'],
-                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        name_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-        name_entry.pack(fill='x', pady=(0, 10))
-        self.fields['name'] = name_entry
-        
-        for i in range(1, 4):
-            tk.Label(form_frame, text=f"CW{i} (0-20):", bg=COLORS['content'],
-                    fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-            mark_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-            mark_entry.pack(fill='x', pady=(0, 10))
-            self.fields[f'mark{i}'] = mark_entry
-        
-        tk.Label(form_frame, text="Exam (0-100):", bg=COLORS['content'],
-                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        exam_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-        exam_entry.pack(fill='x', pady=(0, 20))
-        self.fields['exam'] = exam_entry
-        
-        # Buttons are now correctly packed into form_frame (the scrollable content)
+    def build_form_buttons(self, form_frame, on_save, on_cancel):
+        """Save and Cancel buttons under a form"""
         btn_frame = tk.Frame(form_frame, bg=COLORS['content'])
         btn_frame.pack(fill='x', pady=10)
         
         save_btn = tk.Label(btn_frame, text="Save", bg=COLORS['success'],
                         fg='white', font=(FONT, FONT_SIZES['form'], 'bold'), cursor='hand2')
         save_btn.pack(side='left', padx=(0, 10), pady=10)
-        save_btn.bind('<Button-1>', lambda e: self.save_new())
+        save_btn.bind('<Button-1>', lambda e: on_save())
         save_btn.bind('<Enter>', lambda e: save_btn.config(bg='#219955'))
         save_btn.bind('<Leave>', lambda e: save_btn.config(bg=COLORS['success']))
         
         cancel_btn = tk.Label(btn_frame, text="Cancel", bg=COLORS['danger'],
                         fg='white', font=(FONT, FONT_SIZES['form'], 'bold'), cursor='hand2')
         cancel_btn.pack(side='left', pady=10)
-        cancel_btn.bind('<Button-1>', lambda e: self.show_empty())
+        cancel_btn.bind('<Button-1>', lambda e: on_cancel())
         cancel_btn.bind('<Enter>', lambda e: cancel_btn.config(bg='#A93226'))
         cancel_btn.bind('<Leave>', lambda e: cancel_btn.config(bg=COLORS['danger']))
 
+    def build_form_entry(self, form_frame, text, pady=(0, 10)):
+        """Label and entry for one form field"""
+        tk.Label(form_frame, text=text, bg=COLORS['content'],
+                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
+        entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
+        entry.pack(fill='x', pady=pady)
+        return entry
+
+    def build_add_panel(self):
+        """Empty student form"""
+        panel = tk.Frame(self.content, bg=COLORS['content'])
+        form_frame = self.build_form_frame(panel)
+        
+        self.fields = {
+            'id': self.build_form_entry(form_frame, "Student ID:"),
+            'name': self.build_form_entry(form_frame, "Name:")
+        }
+        for i in range(1, 4):
+            self.fields[f'mark{i}'] = self.build_form_entry(form_frame, f"CW{i} (0-20):")
+        self.fields['exam'] = self.build_form_entry(form_frame, "Exam (0-100):", pady=(0, 20))
+        
+        self.build_form_buttons(form_frame, self.save_new, self.show_empty)
+        return panel
+
+    def add(self):
+        if not self.check_loaded():
+            return
+        self.show_panel('add')
+        self.title.config(text="Add Student")
+        
+        for entry in self.fields.values():
+            entry.delete(0, tk.END)
+
     def save_new(self):
         """Save new student"""
         try:
@@ -473,18 +1080,20 @@ class StudentManager:
                 self.show_error_notification("Error: Exam mark must be 0-100")
                 return
             
-            if any(s.student_id == student_id for s in self.students):
+            if student_id in self.by_id:
                 self.show_error_notification("Error: Student ID already exists")
                 return
             
             # Create and save
             new_student = Student(student_id, name, *marks, exam)
             self.students.append(new_student)
-            save_students(self.students)
+            self.track_added(new_student)
+            self.saver.change(OP_ADD, new_student)
             
             # Update UI
-            self.refresh_stats()
-            self.selected_student = new_student
+            self.patch_rows(None, self.row_in_view(new_student))
+            self.mark_dirty('stats')
+            self.select_student(new_student)
             self.show_details(new_student)
             self.title.config(text=f"✓ Added: {name}")
             
@@ -534,88 +1143,49 @@ class StudentManager:
 
     def edit(self):
         """Edit selected student"""
+        if not self.check_loaded():
+            return
         if self.selected_student is None:
             self.show_popup()
         else:
             self.show_edit_form(self.selected_student)
 
-    def show_edit_form(self, student):
-        self.title.config(text=f"Edit: {student.name}")
-        
-        for w in self.content.winfo_children():
-            w.destroy()
-        
-        scroll_frame = tk.Frame(self.content, bg=COLORS['content'])
-        scroll_frame.pack(fill='both', expand=True)
-        
-        canvas = tk.Canvas(scroll_frame, bg=COLORS['content'], highlightthickness=0)
-        scrollbar = tk.Scrollbar(scroll_frame, orient="vertical", command=canvas.yview)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        form_frame = tk.Frame(canvas, bg=COLORS['content'])
-        
-        form_frame.bind("<Configure>", 
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"), width=e.width))
-        
-        canvas_window = canvas.create_window((0, 0), window=form_frame, anchor="nw")
-        
-        canvas.bind("<Configure>", 
-            lambda e: canvas.itemconfig(canvas_window, width=e.width))
-
-        self.edit_fields = {}
+    def build_edit_panel(self):
+        """Student form with a fixed ID, filled in by show_edit_form"""
+        panel = tk.Frame(self.content, bg=COLORS['content'])
+        form_frame = self.build_form_frame(panel)
         
         tk.Label(form_frame, text="Student ID:", bg=COLORS['content'],
                 fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        id_label = tk.Label(form_frame, text=str(student.student_id), 
+        self.edit_id_label = tk.Label(form_frame, text="", 
                         bg=COLORS['content'], fg='black', font=(FONT, FONT_SIZES['form']))
-        id_label.pack(anchor='w', pady=(0, 10))
+        self.edit_id_label.pack(anchor='w', pady=(0, 10))
         
-        tk.Label(form_frame, text="Name:", bg=COLORS['content'],
-                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        name_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-        name_entry.insert(0, student.name)
-        name_entry.pack(fill='x', pady=(0, 10))
-        self.edit_fields['name'] = name_entry
-        
-        marks = [student.mark1, student.mark2, student.mark3]
+        self.edit_fields = {'name': self.build_form_entry(form_frame, "Name:")}
         for i in range(1, 4):
-            tk.Label(form_frame, text=f"CW{i} (0-20):", bg=COLORS['content'],
-                    fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-            mark_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-            mark_entry.insert(0, str(marks[i-1]))
-            mark_entry.pack(fill='x', pady=(0, 10))
-            self.edit_fields[f'mark{i}'] = mark_entry
-        
-        tk.Label(form_frame, text="Exam (0-100):", bg=COLORS['content'],
-                fg='black', font=(FONT, FONT_SIZES['form'], 'bold')).pack(anchor='w', pady=(5, 0))
-        exam_entry = tk.Entry(form_frame, font=(FONT, FONT_SIZES['form']), width=30)
-        exam_entry.insert(0, str(student.exam_mark))
-        exam_entry.pack(fill='x', pady=(0, 20))
-        self.edit_fields['exam'] = exam_entry
-        
-        btn_frame = tk.Frame(form_frame, bg=COLORS['content'])
-        btn_frame.pack(fill='x', pady=10)
+            self.edit_fields[f'mark{i}'] = self.build_form_entry(form_frame, f"CW{i} (0-20):")
+        self.edit_fields['exam'] = self.build_form_entry(form_frame, "Exam (0-100):", pady=(0, 20))
         
-        save_btn = tk.Label(btn_frame, text="Save", bg=COLORS['success'],
-                        fg='white', font=(FONT, FONT_SIZES['form'], 'bold'), cursor='hand2')
-        save_btn.pack(side='left', padx=(0, 10), pady=10)
-        save_btn.bind('<Button-1>', lambda e: self.save_edit(student))
-        save_btn.bind('<Enter>', lambda e: save_btn.config(bg='#219955'))
-        save_btn.bind('<Leave>', lambda e: save_btn.config(bg=COLORS['success']))
+        self.build_form_buttons(form_frame, lambda: self.save_edit(self.edit_student),
+                                lambda: self.show_details(self.edit_student))
+        return panel
+
+    def show_edit_form(self, student):
+        self.show_panel('edit')
+        self.edit_student = student
+        self.title.config(text=f"Edit: {student.name}")
         
-        cancel_btn = tk.Label(btn_frame, text="Cancel", bg=COLORS['danger'],
-                            fg='white', font=(FONT, FONT_SIZES['form'], 'bold'), cursor='hand2')
-        cancel_btn.pack(side='left', pady=10)
-        cancel_btn.bind('<Button-1>', lambda e: self.show_details(student))
-        cancel_btn.bind('<Enter>', lambda e: cancel_btn.config(bg='#A93226'))
-        cancel_btn.bind('<Leave>', lambda e: cancel_btn.config(bg=COLORS['danger']))
+        self.edit_id_label.config(text=str(student.student_id))
+        values = {'name': student.name, 'mark1': student.mark1, 'mark2': student.mark2,
+                  'mark3': student.mark3, 'exam': student.exam_mark}
+        for key, entry in self.edit_fields.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, str(values[key]))
 
     def save_edit(self, student):
         """Save edited student"""
+        if not self.check_current(student):
+            return
         try:
             name = self.edit_fields['name'].get().strip()
             marks = [int(self.edit_fields[f'mark{i}'].get()) for i in range(1, 4)]
@@ -635,15 +1205,17 @@ class StudentManager:
                 return
             
             # Update student
+            old_row = self.row_in_view(student)
             student.name = name
             student.mark1, student.mark2, student.mark3 = marks
             student.exam_mark = exam
-            student.calculate_totals()
+            self.track_updated(student)
             
-            save_students(self.students)
+            self.saver.change(OP_UPDATE, student)
             
             # Update UI
-            self.refresh_stats()
+            self.patch_rows(old_row, self.row_in_view(student))
+            self.mark_dirty('stats')
             self.show_details(student)
             self.title.config(text=f"✓ Updated: {name}")
             
@@ -652,122 +1224,363 @@ class StudentManager:
 
     def delete(self):
         """Delete selected student"""
+        if not self.check_loaded():
+            return
         if self.selected_student is None:
             self.show_popup()
         else:
             self.show_delete_confirm(self.selected_student)
 
-    def show_delete_confirm(self, student):
-        """Show delete confirmation"""
-        self.title.config(text="Confirm Delete")
-        
-        for w in self.content.winfo_children():
-            w.destroy()
+    def build_delete_panel(self):
+        """Delete confirmation, filled in by show_delete_confirm"""
+        panel = tk.Frame(self.content, bg=COLORS['content'])
         
         # Warning message
-        warn_frame = tk.Frame(self.content, bg=COLORS['content'])
+        warn_frame = tk.Frame(panel, bg=COLORS['content'])
         warn_frame.pack(fill='x', pady=20)
         
         tk.Label(warn_frame, text="⚠️", bg=COLORS['content'], fg='orange',
                 font=(FONT, 36)).pack(pady=(0, 10))
         
-        tk.Label(warn_frame, text=f"Delete {student.name}?", 
-                bg=COLORS['content'], fg='black', font=(FONT, 16, 'bold')).pack()
+        self.delete_name_label = tk.Label(warn_frame, text="", 
+                bg=COLORS['content'], fg='black', font=(FONT, 16, 'bold'))
+        self.delete_name_label.pack()
         
-        tk.Label(warn_frame, text=f"ID: {student.student_id}", 
-                bg=COLORS['content'], fg='black', font=(FONT, 12)).pack(pady=5)
+        self.delete_id_label = tk.Label(warn_frame, text="", 
+                bg=COLORS['content'], fg='black', font=(FONT, 12))
+        self.delete_id_label.pack(pady=5)
         
         tk.Label(warn_frame, text="This action cannot be undone!", 
                 bg=COLORS['content'], fg='red', font=(FONT, 10, 'bold')).pack()
         
         # Buttons
-        btn_frame = tk.Frame(self.content, bg=COLORS['content'])
+        btn_frame = tk.Frame(panel, bg=COLORS['content'])
         btn_frame.pack(fill='x', pady=20)
         
         del_btn = tk.Label(btn_frame, text="DELETE", bg=COLORS['danger'],
                         fg='white', font=(FONT, 14, 'bold'), cursor='hand2')
         del_btn.pack(side='left', padx=(0, 10))
-        del_btn.bind('<Button-1>', lambda e: self.confirm_delete(student))
+        del_btn.bind('<Button-1>', lambda e: self.confirm_delete(self.delete_student))
         del_btn.bind('<Enter>', lambda e: del_btn.config(bg='#A93226'))
         del_btn.bind('<Leave>', lambda e: del_btn.config(bg=COLORS['danger']))
         
         cancel_btn = tk.Label(btn_frame, text="Cancel", bg=COLORS['button'],
                             fg='black', font=(FONT, 14, 'bold'), cursor='hand2')
         cancel_btn.pack(side='left')
-        cancel_btn.bind('<Button-1>', lambda e: self.show_details(student))
+        cancel_btn.bind('<Button-1>', lambda e: self.show_details(self.delete_student))
         cancel_btn.bind('<Enter>', lambda e: cancel_btn.config(bg=COLORS['hover']))
         cancel_btn.bind('<Leave>', lambda e: cancel_btn.config(bg=COLORS['button']))
+        return panel
+
+    def show_delete_confirm(self, student):
+        """Show delete confirmation"""
+        self.show_panel('delete')
+        self.delete_student = student
+        self.title.config(text="Confirm Delete")
+        
+        self.delete_name_label.config(text=f"Delete {student.name}?")
+        self.delete_id_label.config(text=f"ID: {student.student_id}")
 
     def confirm_delete(self, student):
         """Actually delete student"""
+        if not self.check_current(student):
+            return
+        old_row = self.row_in_view(student)
         self.students.remove(student)
-        save_students(self.students)
+        self.track_removed(student)
+        self.saver.change(OP_DELETE, student)
         
         if self.selected_student == student:
             self.selected_student = None
         
-        self.refresh_stats()
+        self.patch_rows(old_row, None)
+        self.mark_dirty('stats')
         self.show_empty()
         self.title.config(text=f"✓ Deleted: {student.name}")
 
     def highest(self):
         """Show highest scoring student"""
+        if not self.check_loaded():
+            return
         if not self.students:
             self.show_error_notification("No students in database")
             return
         
-        # Find student with highest percentage
-        highest_student = max(self.students, key=lambda s: s.percentage)
-        self.selected_student = highest_student
+        # Head of the maintained rank order
+        highest_student = self.sorted_views.top(1)[0]
+        self.select_student(highest_student)
         self.show_details(highest_student)
         self.title.config(text=f"{highest_student.name}")
 
     def lowest(self):
         """Show lowest scoring student"""
+        if not self.check_loaded():
+            return
         if not self.students:
             self.show_error_notification("No students in database")
             return
         
-        # Find student with lowest percentage
-        lowest_student = min(self.students, key=lambda s: s.percentage)
-        self.selected_student = lowest_student
+        # Head of the maintained percentage order
+        lowest_student = self.sorted_views.bottom(1)[0]
+        self.select_student(lowest_student)
         self.show_details(lowest_student)
         self.title.config(text=f"{lowest_student.name}")
 
+    def build_leaderboard_panel(self):
+        """N picker and two columns of LEADERBOARD['max_n'] reusable rows"""
+        panel = tk.Frame(self.content, bg=COLORS['content'])
+        self.leaderboard_n = tk.IntVar(value=LEADERBOARD['default_n'])
+        
+        # N picker
+        n_frame = tk.Frame(panel, bg=COLORS['content'])
+        n_frame.pack(fill='x', pady=(0, 10))
+        
+        tk.Label(n_frame, text="Show top / bottom:", bg=COLORS['content'], fg='black',
+                font=(FONT, FONT_SIZES['detail_label'], 'bold')).pack(side='left')
+        n_box = tk.Spinbox(n_frame, from_=1, to=LEADERBOARD['max_n'], width=4,
+                        textvariable=self.leaderboard_n, font=(FONT, FONT_SIZES['form']),
+                        command=self.show_leaderboard)
+        n_box.pack(side='left', padx=5)
+        n_box.bind('<Return>', lambda e: self.show_leaderboard())
+        
+        columns = tk.Frame(panel, bg=COLORS['content'])
+        columns.pack(fill='both', expand=True)
+        
+        self.leaderboard_headings = {}
+        self.leaderboard_rows = {}  # Board -> row labels, the first leaderboard_shown are packed
+        self.leaderboard_students = {}  # Board -> students currently listed
+        self.leaderboard_shown = 0
+        
+        for board in ["Top", "Bottom"]:
+            column = tk.Frame(columns, bg=COLORS['content'])
+            column.pack(side='left', fill='both', expand=True, anchor='n')
+            
+            heading = tk.Label(column, text="", bg=COLORS['content'], fg='black',
+                    font=(FONT, FONT_SIZES['detail_label'], 'bold'), anchor='w')
+            heading.pack(fill='x')
+            self.leaderboard_headings[board] = heading
+            
+            rows = []
+            for i in range(LEADERBOARD['max_n']):
+                row = tk.Label(column, text="", bg=COLORS['content'], fg='black',
+                            font=(FONT, FONT_SIZES['detail_value']), anchor='w', cursor='hand2')
+                row.bind('<Button-1>', lambda e, b=board, i=i: self.open_student(self.leaderboard_students[b][i]))
+                row.bind('<Enter>', lambda e, lbl=row: lbl.config(bg=COLORS['hover']))
+                row.bind('<Leave>', lambda e, lbl=row: lbl.config(bg=COLORS['content']))
+                rows.append(row)
+            self.leaderboard_rows[board] = rows
+        
+        return panel
+
+    def show_leaderboard(self):
+        """Show the top and bottom N students side by side"""
+        if not self.check_loaded():
+            return
+        self.show_panel('leaderboard')
+        self.title.config(text="Leaderboard")
+        
+        try:
+            n = max(1, min(int(self.leaderboard_n.get()), LEADERBOARD['max_n']))
+        except (ValueError, tk.TclError):
+            n = LEADERBOARD['default_n']
+        
+        boards = [("Top", self.sorted_views.top(n)), ("Bottom", self.sorted_views.bottom(n))]
+        for board, students in boards:
+            self.leaderboard_headings[board].config(text=f"{board} {n}")
+            self.leaderboard_students[board] = students
+            
+            rows = self.leaderboard_rows[board]
+            for rank, student in enumerate(students, start=1):
+                rows[rank - 1].config(text=f"{rank}. {student.name} ({student.percentage:.1f}%)",
+                                    bg=COLORS['content'])
+            
+            # Unused rows are always at the end, so packing in order keeps them sorted
+            for i in range(self.leaderboard_shown, len(students)):
+                rows[i].pack(fill='x')
+            for i in range(len(students), self.leaderboard_shown):
+                rows[i].pack_forget()
+        
+        self.leaderboard_shown = len(boards[0][1])
+
+    def open_student(self, student):
+        """Select a student, bring its row into view and show its details"""
+        # A leaderboard row can outlive a student the watcher removed
+        if not self.check_current(student):
+            return
+        
+        # A search that hides the student is in the way
+        row = self.row_in_view(student)
+        if row is None:
+            self.clear_search()
+            row = self.row_in_view(student)
+        
+        self.select_student(student)
+        if row is not None:
+            self.scroll_to_row(row - TABLE['pool_rows'] // 2)
+        self.show_details(student)
+
+    def import_students(self):
+        """Validate a CSV file in the background and merge the good rows"""
+        if not self.check_loaded():
+            return
+        
+        path = filedialog.askopenfilename(
+            title="Import students",
+            filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        
+        self.loading = True  # Holds off edits until the merge
+        self.title.config(text="Importing...")
+        self.import_queue = queue.Queue()
+        existing_ids = set(self.by_id)
+        
+        def worker():
+            try:
+                self.import_queue.put(('done', import_csv(path, existing_ids)))
+            except Exception as e:
+                self.import_queue.put(('error', e))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(LOAD['poll_ms'], lambda: self.poll_import(path))
+
+    def poll_import(self, path):
+        """Wait for the import worker, then merge in one go"""
+        try:
+            kind, payload = self.import_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(LOAD['poll_ms'], lambda: self.poll_import(path))
+            return
+        
+        self.loading = False
+        if kind == 'error':
+            self.title.config(text="")
+            self.show_error_notification(f"Error: Could not import file ({payload})")
+            return
+        
+        students, rejected = payload
+        if students:
+            self.students.extend(students)
+            self.track_added_many(students)
+            self.saver.save_all()
+            self.refresh_stats()
+        
+        if rejected:
+            report = write_rejected_report(path, rejected)
+            print(f"Rejected rows written to {report}")
+            self.show_error_notification(f"{len(rejected)} rows rejected, see {os.path.basename(report)}")
+        self.show_empty()
+        self.title.config(text=f"✓ Imported {len(students)} students")
+
     def show_msg(self, msg, type="info"):
         """Show temporary message"""
-        original = self.title.cget("text")
+        # Back-to-back messages restore the title from before the first one
+        if self.msg_timer:
+            self.root.after_cancel(self.msg_timer)
+        else:
+            self.msg_original = self.title.cget("text")
         
         if type == "error":
             self.title.config(text=f"❌ {msg}", fg="red")
         else:
             self.title.config(text=f"✓ {msg}", fg="green")
         
-        self.root.after(3000, lambda: self.title.config(text=original, fg="black"))
+        self.msg_timer = self.root.after(3000, self.restore_title)
+
+    def restore_title(self):
+        """Put the title back after show_msg"""
+        self.msg_timer = None
+        self.title.config(text=self.msg_original, fg="black")
+
+    def on_close(self):
+        """Finish pending saves, then quit"""
+        self.saver.close()
+        self.root.destroy()
 
     def show_empty(self):
         """Show empty details panel"""
-        for w in self.content.winfo_children():
-            w.destroy()
+        if self.current_panel is not None:
+            self.current_panel.pack_forget()
+            self.current_panel = None
+        self.details_student = None
         self.title.config(text="")
 
+    @timed()
     def refresh_stats(self):
-        """Refresh statistics and student list"""
-        # Remember current sort
-        current_sort = self.sort_var.get()
-        
-        self.refresh_student_list()
+        """Refresh statistics and student list on the next idle pass"""
+        # The sorted views are already current, only search results need redoing
+        self.mark_dirty('view' if self.search_query else 'table', 'stats')
+
+    def patch_rows(self, old_row, new_row):
+        """Redraw only the table rows a one-student change moved or touched
+
+        old_row and new_row are the student's positions in self.table_view before
+        and after the change, None for a student that was added or deleted.
+        """
+        if self.search_query:
+            # Search results are a filtered copy, rebuild them
+            self.mark_dirty('view')
+            return
         
-        # Re-apply current sort
-        self.apply_sorting()
+        end = len(self.table_view) + 1  # Past the last row, before or after the change
+        changed = None
+        if old_row is None:
+            # Added, everything from new_row on moves down one row
+            if new_row < self.first_row:
+                self.first_row += 1  # Same students stay on screen
+            else:
+                changed = (new_row, end)
+        elif new_row is None:
+            # Deleted, everything after old_row moves up one row
+            if old_row < self.first_row:
+                self.first_row -= 1
+            else:
+                changed = (old_row, end)
+        else:
+            # Edited, only the rows between its old and new place move
+            changed = (min(old_row, new_row), max(old_row, new_row) + 1)
         
-        # Update the stats display
-        for widget in self.canvas.winfo_children():
-            if hasattr(widget, 'winfo_children'):
-                children = widget.winfo_children()
-                if children and any('frame' in str(child) for child in children):
-                    widget_info = str(widget)
-                    if 'frame' in widget_info.lower() and 'canvas' not in widget_info.lower():
-                        widget.destroy()
+        if self.first_row > max(0, len(self.table_view) - TABLE['pool_rows']):
+            # A delete near the end pulls the whole window up
+            self.mark_dirty('table')
+            return
         
-        self.setup_stats()
\ No newline at end of file
+        if changed:
+            first = max(changed[0], self.first_row) - self.first_row
+            last = min(changed[1], self.first_row + TABLE['pool_rows']) - self.first_row
+            self.dirty_slots.update(range(first, last))
+        self.mark_dirty('scrollbar')
+
+    def mark_dirty(self, *regions):
+        """Flag regions as stale: 'view' (search results), 'table', 'scrollbar', 'stats' or 'details'"""
+        self.dirty.update(regions)
+        if self.render_job is None:
+            self.render_job = self.root.after_idle(self.render)
+
+    @timed()
+    def render(self):
+        """Redraw each stale region once, however often it was marked"""
+        self.render_job = None
+        dirty, self.dirty = self.dirty, set()
+        slots, self.dirty_slots = self.dirty_slots, set()
+        
+        if 'view' in dirty:
+            self.update_view()
+        if 'view' in dirty or 'table' in dirty:
+            self.refresh_student_list()
+        elif slots or 'scrollbar' in dirty:
+            for slot in sorted(slots):
+                self.render_slot(slot)
+            self.update_scrollbar()
+        if 'stats' in dirty:
+            self.update_stats_display()
+        if 'details' in dirty and self.details_student is not None:
+            # The student may have been deleted meanwhile
+            if self.by_id.get(self.details_student.student_id) is self.details_student:
+                self.show_details(self.details_student)
+            else:
+                self.show_empty()
+        elif 'details' in dirty and self.current_panel is not None \
+                and self.current_panel is self.panels.get('leaderboard'):
+            # Rankings may have moved under an open leaderboard
+            self.show_leaderboard()
@@ -0,0 +1,289 @@
+import heapq
+from array import array
+
+# NumPy is optional, the plain array fallback gives the same results
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GRADE_BANDS = [(70, 'A'), (60, 'B'), (50, 'C'), (40, 'D')]
+
+class StudentView:
+    """Student-like view of one row of a StudentTable
+
+    The view points at a row number, so it goes stale once rows before
+    it are removed.
+    """
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    @property
+    def student_id(self):
+        return self.table.ids[self.row]
+
+    @property
+    def name(self):
+        return self.table.name(self.row)
+
+    @name.setter
+    def name(self, value):
+        self.table.set_name(self.row, value)
+
+    @property
+    def mark1(self):
+        return self.table.mark1[self.row]
+
+    @mark1.setter
+    def mark1(self, value):
+        self.table.mark1[self.row] = int(value)
+
+    @property
+    def mark2(self):
+        return self.table.mark2[self.row]
+
+    @mark2.setter
+    def mark2(self, value):
+        self.table.mark2[self.row] = int(value)
+
+    @property
+    def mark3(self):
+        return self.table.mark3[self.row]
+
+    @mark3.setter
+    def mark3(self, value):
+        self.table.mark3[self.row] = int(value)
+
+    @property
+    def exam_mark(self):
+        return self.table.exam[self.row]
+
+    @exam_mark.setter
+    def exam_mark(self, value):
+        self.table.exam[self.row] = int(value)
+
+    @property
+    def coursework_total(self):
+        return self.mark1 + self.mark2 + self.mark3
+
+    @property
+    def total_score(self):
+        return self.coursework_total + self.exam_mark
+
+    @property
+    def percentage(self):
+        return (self.total_score / 160) * 100
+
+    @property
+    def grade(self):
+        return grade_for(self.percentage)
+
+def grade_for(perc):
+    """Letter grade for a percentage, same bands as Student.grade"""
+    for band, grade in GRADE_BANDS:
+        if perc >= band:
+            return grade
+    return 'F'
+
+class StudentTable:
+    """Columnar student store, one contiguous array per field
+
+    Names live in a single UTF-8 pool addressed by start/length columns.
+    Marks have to fit a signed 16-bit column, IDs a signed 32-bit one and
+    names 65535 UTF-8 bytes, append raises ValueError for anything bigger.
+    """
+    def __init__(self, students=()):
+        self.ids = array('i')
+        self.mark1 = array('h')
+        self.mark2 = array('h')
+        self.mark3 = array('h')
+        self.exam = array('h')
+        self.name_pool = bytearray()
+        self.name_start = array('L')
+        self.name_len = array('H')
+
+        for student in students:
+            self.append(student.student_id, student.name, student.mark1,
+                        student.mark2, student.mark3, student.exam_mark)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("student row out of range")
+        return StudentView(self, row)
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield StudentView(self, row)
+
+    def append(self, student_id, name, mark1, mark2, mark3, exam_mark):
+        """Add one student as a new row"""
+        fields = [int(student_id), int(mark1), int(mark2), int(mark3), int(exam_mark)]
+        encoded = name.encode('utf-8')
+        columns = (self.ids, self.mark1, self.mark2, self.mark3, self.exam, self.name_len)
+        rows = len(self)
+        try:
+            for column, value in zip(columns, fields + [len(encoded)]):
+                column.append(value)
+        except OverflowError:
+            # Put back the columns that took a value before the one that failed
+            for column in columns:
+                del column[rows:]
+            raise ValueError(f"Student {student_id} does not fit a StudentTable row") from None
+        self.name_start.append(len(self.name_pool))
+        self.name_pool += encoded
+
+    def remove(self, row):
+        """Remove a row, the name bytes stay in the pool until compact_names"""
+        for column in (self.ids, self.mark1, self.mark2, self.mark3,
+                       self.exam, self.name_start, self.name_len):
+            del column[row]
+
+    def name(self, row):
+        start = self.name_start[row]
+        return self.name_pool[start:start + self.name_len[row]].decode('utf-8')
+
+    def set_name(self, row, name):
+        encoded = name.encode('utf-8')
+        self.name_start[row] = len(self.name_pool)
+        self.name_len[row] = len(encoded)
+        self.name_pool += encoded
+
+    def compact_names(self):
+        """Rebuild the name pool without bytes left behind by edits and deletes"""
+        pool = bytearray()
+        for row in range(len(self)):
+            start = self.name_start[row]
+            self.name_start[row] = len(pool)
+            pool += self.name_pool[start:start + self.name_len[row]]
+        self.name_pool = pool
+
+    def find(self, student_id):
+        """Row number of a student ID, or None"""
+        if not len(self):
+            return None
+        if np is not None:
+            rows = np.flatnonzero(np.frombuffer(self.ids, dtype=np.int32) == student_id)
+            return int(rows[0]) if len(rows) else None
+        try:
+            return self.ids.index(student_id)
+        except ValueError:
+            return None
+
+    # Derived columns, computed for every row at once
+
+    def coursework_totals(self):
+        if np is not None:
+            return (np.frombuffer(self.mark1, dtype=np.int16).astype(np.int32)
+                    + np.frombuffer(self.mark2, dtype=np.int16)
+                    + np.frombuffer(self.mark3, dtype=np.int16))
+        return array('i', map(sum, zip(self.mark1, self.mark2, self.mark3)))
+
+    def total_scores(self):
+        if np is not None:
+            return self.coursework_totals() + np.frombuffer(self.exam, dtype=np.int16)
+        return array('i', map(sum, zip(self.coursework_totals(), self.exam)))
+
+    def percentages(self):
+        if np is not None:
+            return (self.total_scores() / 160) * 100
+        return array('d', ((total / 160) * 100 for total in self.total_scores()))
+
+    def grades(self):
+        percentages = self.percentages()
+        if np is not None:
+            bands = [percentages >= band for band, _ in GRADE_BANDS]
+            return np.select(bands, [grade for _, grade in GRADE_BANDS], 'F')
+        return [grade_for(perc) for perc in percentages]
+
+    # Roster queries
+
+    def stats(self):
+        """Count, average, highest, passing percentage and grade counts"""
+        count = len(self)
+        grade_counts = {grade: 0 for _, grade in GRADE_BANDS}
+        grade_counts['F'] = 0
+        if not count:
+            return {'count': 0, 'average': 0, 'highest': 0, 'passing': 0,
+                    'grade_counts': grade_counts}
+
+        percentages = self.percentages()
+        if np is not None:
+            letters, counts = np.unique(self.grades(), return_counts=True)
+            grade_counts.update(zip(letters.tolist(), counts.tolist()))
+            passing = int(np.count_nonzero(percentages >= 40))
+            average = float(percentages.mean())
+            highest = float(percentages.max())
+        else:
+            for grade in self.grades():
+                grade_counts[grade] += 1
+            passing = sum(1 for perc in percentages if perc >= 40)
+            average = sum(percentages) / count
+            highest = max(percentages)
+
+        return {'count': count, 'average': average, 'highest': highest,
+                'passing': (passing / count) * 100, 'grade_counts': grade_counts}
+
+    def order_by(self, key):
+        """Views of every row in a SORT_KEYS order: 'id', 'name', 'percentage' or 'grade'
+
+        Ties are broken the same way as SORT_KEYS, ending in the ID.
+        """
+        names = [self.name(row).lower() for row in range(len(self))] if key in ("name", "grade") else None
+        if np is not None:
+            ids = np.frombuffer(self.ids, dtype=np.int32)
+            # lexsort sorts by the last key first
+            keys = {'id': (ids,),
+                    'name': (ids, np.array(names, dtype=str)),
+                    'percentage': (ids, self.total_scores()),
+                    'grade': (ids, np.array(names, dtype=str), self.grades())}[key]
+            rows = np.lexsort(keys).tolist()
+        else:
+            if key == "id":
+                sort_key = self.ids.__getitem__
+            elif key == "name":
+                sort_key = lambda row: (names[row], self.ids[row])
+            elif key == "percentage":
+                totals = self.total_scores()
+                sort_key = lambda row: (totals[row], self.ids[row])
+            else:
+                grades = self.grades()
+                sort_key = lambda row: (grades[row], names[row], self.ids[row])
+            rows = sorted(range(len(self)), key=sort_key)
+        return [StudentView(self, row) for row in rows]
+
+    def top(self, n):
+        """Views of the best n students, ties to the lower ID"""
+        return self.ranked(n, descending=True)
+
+    def bottom(self, n):
+        """Views of the worst n students, ties to the lower ID"""
+        return self.ranked(n, descending=False)
+
+    def ranked(self, n, descending):
+        totals = self.total_scores()
+        if np is not None:
+            ids = np.frombuffer(self.ids, dtype=np.int32)
+            rows = np.lexsort((ids, -totals if descending else totals))[:n].tolist()
+        else:
+            sign = -1 if descending else 1
+            rows = heapq.nsmallest(n, range(len(self)),
+                                   key=lambda row: (sign * totals[row], self.ids[row]))
+        return [StudentView(self, row) for row in rows]
+
+    def highest(self):
+        """View of the top scoring student, or None"""
+        students = self.top(1)
+        return students[0] if students else None
+
+    def lowest(self):
+        """View of the lowest scoring student, or None"""
+        students = self.bottom(1)
+        return students[0] if students else None
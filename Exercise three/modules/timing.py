@@ -0,0 +1,85 @@
+import functools
+import json
+import math
+import time
+from collections import deque
+from modules.constants import TIMING
+
+# Off unless TIMING says otherwise or the overlay is open, a disabled
+# span costs one flag check
+enabled = TIMING['enabled']
+samples = {}  # span name -> recent durations in ms, newest last
+
+def set_enabled(on):
+    """Start or stop collecting timings"""
+    global enabled
+    enabled = on
+
+def record(name, ms):
+    """Store one duration for a span"""
+    durations = samples.get(name)
+    if durations is None:
+        durations = samples.setdefault(name, deque(maxlen=TIMING['samples']))
+    durations.append(ms)
+
+def timed(name=None):
+    """Decorator that records how long each call takes"""
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(span_name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorate
+
+class span:
+    """Context manager version of timed for a block of code"""
+    def __init__(self, name):
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if enabled:
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+def percentile(durations, fraction):
+    """Nearest-rank percentile of a list of durations"""
+    ordered = sorted(durations)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def summary():
+    """Count, last and p95 (in ms) for every span seen so far"""
+    result = {}
+    for name, durations in list(samples.items()):
+        durations = list(durations)
+        if durations:
+            result[name] = {'count': len(durations), 'last': durations[-1],
+                            'p95': percentile(durations, 0.95)}
+    return result
+
+def dump(path=TIMING['dump_file']):
+    """Write the summary and raw samples to a JSON file"""
+    report = {
+        'summary': summary(),
+        'samples': {name: list(durations) for name, durations in list(samples.items())},
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+    return path
+
+def reset():
+    """Forget every collected timing"""
+    samples.clear()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from modules.file_manager import (BinaryStudentFile, text_to_binary, binary_to_text,
+                                  write_binary_file, format_student)
+from modules.student import Student
+
+class BinaryFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.text = os.path.join(self.dir.name, "students.txt")
+        self.binary = os.path.join(self.dir.name, "students.bin")
+        self.students = [Student(1000 + i, f"Stüdent {i}", i, 20 - i, i % 7, 90 - i)
+                         for i in range(20)]
+        with open(self.text, "w") as file:
+            file.writelines(format_student(student) for student in self.students)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def read_text(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_text_binary_text_is_byte_identical(self):
+        back = os.path.join(self.dir.name, "back.txt")
+        text_to_binary(self.text, self.binary, self.text + ".journal")
+        binary_to_text(self.binary, back)
+
+        self.assertEqual(self.read_text(back), self.read_text(self.text))
+
+    def test_in_place_changes_survive_reopening(self):
+        write_binary_file(self.students, self.binary)
+        records = BinaryStudentFile(self.binary)
+        edited = Student(1003, "Edited", 1, 2, 3, 4)
+        records.write(records.find(1003), edited)
+        records.delete(records.find(1005))
+        records.append(Student(2000, "Added", 5, 6, 7, 8))
+        records.close()
+
+        expected = [edited if s.student_id == 1003 else s
+                    for s in self.students if s.student_id != 1005]
+        expected.append(Student(2000, "Added", 5, 6, 7, 8))
+
+        records = BinaryStudentFile(self.binary)
+        try:
+            self.assertEqual([format_student(s) for s in records],
+                             [format_student(s) for s in expected])
+            self.assertIsNone(records.find(1005))
+        finally:
+            records.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from modules.file_manager import iter_text_students, format_student
+from modules.file_watcher import diff_file, read_line_hashes, to_line_hashes
+from modules.student import Student
+
+class DiffFileTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "students.txt")
+        self.students = [Student(1000 + i * 10, f"Student {i}", i, i, i, 50 + i) for i in range(6)]
+        self.write(self.students)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, students):
+        with open(self.path, "w") as file:
+            file.writelines(format_student(student) for student in students)
+
+    def test_reports_only_changed_records(self):
+        base = read_line_hashes(self.path)
+        edited = Student(1020, "Edited", 9, 9, 9, 99)
+        added = [Student(1005, "Between", 1, 2, 3, 4), Student(9999, "Last", 5, 6, 7, 8)]
+        students = [edited if s.student_id == 1020 else s
+                    for s in self.students if s.student_id != 1040]
+        self.write(list(reversed(students + added)))
+
+        changes, new_base = diff_file(self.path, base)
+
+        reported = {student_id: student and format_student(student)
+                    for student_id, student in changes}
+        self.assertEqual(reported, {1020: format_student(edited), 1040: None,
+                                    1005: format_student(added[0]),
+                                    9999: format_student(added[1])})
+        after = read_line_hashes(self.path)
+        self.assertEqual((list(new_base.ids), list(new_base.hashes)),
+                         (list(after.ids), list(after.hashes)))
+        self.assertEqual(diff_file(self.path, new_base)[0], [])
+
+    def test_load_baseline_matches_file(self):
+        hashes = {}
+        for _ in iter_text_students(path=self.path, journal_path=self.path + ".journal",
+                                    line_hashes=hashes):
+            pass
+        base = to_line_hashes(hashes)
+        after = read_line_hashes(self.path)
+        self.assertEqual((list(base.ids), list(base.hashes)),
+                         (list(after.ids), list(after.hashes)))
+
+if __name__ == "__main__":
+    unittest.main()
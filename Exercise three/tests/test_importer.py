@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from modules import importer
+from modules.importer import import_csv
+
+class ImportCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "students.csv")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, text):
+        with open(self.path, "w", newline="") as file:
+            file.write(text)
+
+    def test_rejected_rows_report_file_lines(self):
+        self.write('id,name,cw1,cw2,cw3,exam\n'
+                   '1001,"Multi\nLine",1,2,3,4\n'
+                   '\n'
+                   '1002,Good,1,2,3,4\n'
+                   '1003,Bad,21,2,3,4\n'
+                   '1002,Again,1,2,3,4\n')
+
+        students, rejected = import_csv(self.path)
+
+        self.assertEqual([s.student_id for s in students], [1001, 1002])
+        self.assertEqual([(line_no, reason) for line_no, _, reason in rejected],
+                         [(6, "Coursework marks must be 0-20"), (7, "Student ID already exists")])
+
+    def test_parallel_matches_serial(self):
+        rows = [f"{1000 + i},Student {i},{i % 25},1,1,{i % 110}\n" for i in range(300)]
+        self.write("".join(rows))
+        serial = import_csv(self.path, existing_ids={1005})
+
+        settings = dict(importer.IMPORT, parallel_bytes=0, workers=2)
+        with mock.patch.dict(importer.IMPORT, settings):
+            parallel = import_csv(self.path, existing_ids={1005})
+
+        self.assertEqual([s.student_id for s in parallel[0]], [s.student_id for s in serial[0]])
+        self.assertEqual(parallel[1], serial[1])
+
+if __name__ == "__main__":
+    unittest.main()
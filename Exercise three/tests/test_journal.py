@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from modules.file_manager import (load_students, save_students, save_changes, format_student,
+                                  OP_ADD, OP_UPDATE, OP_DELETE)
+from modules.student import Student
+
+def lines(students):
+    return sorted(format_student(student) for student in students)
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "students.txt")
+        self.journal = self.path + ".journal"
+        self.students = [Student(1000 + i, f"Student {i}", i, i, i, 50 + i) for i in range(5)]
+        save_students(self.students, self.path, self.journal)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def load(self):
+        return load_students(self.path, self.journal)
+
+    def test_reload_after_journal_matches_memory(self):
+        edited = self.students[1]
+        edited.name = "Renamed"
+        edited.exam_mark = 99
+        removed = self.students.pop(3)
+        added = Student(2000, "New Student", 10, 11, 12, 60)
+        self.students.append(added)
+
+        save_changes([(OP_UPDATE, edited), (OP_DELETE, removed), (OP_ADD, added)],
+                     self.path, self.journal)
+
+        self.assertTrue(os.path.exists(self.journal))
+        self.assertEqual(lines(self.load()), lines(self.students))
+
+    def test_later_journal_records_win(self):
+        student = self.students[0]
+        save_changes([(OP_DELETE, student)], self.path, self.journal)
+        student.mark1 = 20
+        save_changes([(OP_ADD, student)], self.path, self.journal)
+        student.mark2 = 19
+        save_changes([(OP_UPDATE, student)], self.path, self.journal)
+
+        self.assertEqual(lines(self.load()), lines(self.students))
+
+    def test_full_save_supersedes_journal(self):
+        save_changes([(OP_DELETE, self.students[0])], self.path, self.journal)
+        save_students(self.students, self.path, self.journal)
+
+        self.assertFalse(os.path.exists(self.journal))
+        self.assertEqual(lines(self.load()), lines(self.students))
+
+    def test_torn_last_record_is_skipped(self):
+        edited = self.students[2]
+        edited.mark1 = 17
+        save_changes([(OP_UPDATE, edited)], self.path, self.journal)
+        with open(self.journal, "a") as file:
+            file.write(f"{OP_UPDATE},{self.students[0].student_id},Torn,5,5,5,")
+
+        self.assertEqual(lines(self.load()), lines(self.students))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest import mock
+from modules import saver
+from modules.file_manager import OP_ADD, OP_UPDATE, OP_DELETE
+from modules.saver import Saver
+from modules.student import Student
+
+class FakeRoot:
+    """Collects after() callbacks instead of running a Tk loop"""
+    def __init__(self):
+        self.callbacks = {}
+        self.last = 0
+
+    def after(self, ms, func):
+        self.last += 1
+        self.callbacks[self.last] = func
+        return self.last
+
+    def after_cancel(self, job):
+        self.callbacks.pop(job, None)
+
+class SaverTest(unittest.TestCase):
+    def setUp(self):
+        self.full_saves = []
+        self.change_saves = []
+        self.save_ok = True
+
+        def save_students(students):
+            self.full_saves.append([saver.snapshot(s) for s in students])
+            return self.save_ok
+
+        def save_changes(changes):
+            self.change_saves.append([(op, saver.snapshot(s)) for op, s in changes])
+            return self.save_ok
+
+        patches = [
+            mock.patch.object(saver, 'save_students', save_students),
+            mock.patch.object(saver, 'save_changes', save_changes),
+            mock.patch.object(saver, 'journal_full', lambda: False),
+            mock.patch.object(saver, 'replay_journal', lambda path, changes: None),
+            mock.patch.object(saver, 'STORAGE_FORMAT', 'text'),
+            mock.patch.object(saver, 'JOURNAL_ENABLED', True),
+            mock.patch.dict(saver.WATCH, enabled=False),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.students = [Student(1000 + i, f"Student {i}", i, i, i, 50) for i in range(3)]
+        self.errors = []
+        self.saver = Saver(FakeRoot(), lambda: self.students, on_error=self.errors.append)
+
+    def written(self):
+        """Flush, wait for the worker and report results as the Tk loop would"""
+        self.saver.flush()
+        self.saver.jobs.join()
+        self.saver.poll()
+
+    def test_add_then_delete_writes_nothing(self):
+        student = Student(2000, "New", 1, 2, 3, 4)
+        self.saver.change(OP_ADD, student)
+        self.saver.change(OP_DELETE, student)
+        self.written()
+
+        self.assertEqual(self.change_saves, [])
+        self.assertEqual(self.full_saves, [])
+
+    def test_delete_then_add_becomes_update(self):
+        student = self.students[0]
+        self.saver.change(OP_DELETE, student)
+        student.mark1 = 20
+        self.saver.change(OP_ADD, student)
+        self.written()
+
+        self.assertEqual(self.change_saves, [[(OP_UPDATE, saver.snapshot(student))]])
+
+    def test_edits_to_one_student_are_coalesced(self):
+        student = self.students[1]
+        for mark in (5, 6, 7):
+            student.mark2 = mark
+            self.saver.change(OP_UPDATE, student)
+        self.written()
+
+        self.assertEqual(len(self.change_saves), 1)
+        self.assertEqual(self.change_saves[0], [(OP_UPDATE, saver.snapshot(student))])
+
+    def test_failed_write_falls_back_to_full_rewrite(self):
+        self.save_ok = False
+        self.saver.change(OP_UPDATE, self.students[0])
+        self.written()
+        self.assertEqual(len(self.errors), 1)
+        self.assertTrue(self.saver.pending_full)
+
+        self.save_ok = True
+        self.written()
+        self.assertEqual(self.full_saves, [[saver.snapshot(s) for s in self.students]])
+
+    def test_close_flushes_pending_changes(self):
+        student = self.students[2]
+        student.exam_mark = 99
+        self.saver.change(OP_UPDATE, student)
+        self.saver.close()
+
+        self.assertEqual(self.change_saves, [[(OP_UPDATE, saver.snapshot(student))]])
+
+if __name__ == "__main__":
+    unittest.main()